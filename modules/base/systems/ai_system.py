@@ -1,4 +1,6 @@
-import random
+from typing import Optional
+
+import numpy as np
 import polars as pl
 from src.engine.interfaces import ISystem
 from src.server.state import GameState
@@ -8,6 +10,14 @@ class AISystem(ISystem):
     """
     Basic AI that performs actions for non-player countries.
     """
+    def __init__(self):
+        # Deterministic RNG (replays). The seed lives in 'state.globals["rng_seed"]',
+        # which does not exist yet when modules register, so the generator is
+        # created on the first update.
+        self._rng: Optional[np.random.Generator] = None
+        # (year, month) the AI last ran for; None until the first update
+        self._last_month: Optional[tuple[int, int]] = None
+
     @property
     def id(self) -> str:
         return "base.ai"
@@ -16,33 +26,48 @@ class AISystem(ISystem):
     def dependencies(self) -> list[str]:
         return ["base.time","base.economy", "base.military"]
 
+    @property
+    def read_set(self) -> set[str]:
+        return {"countries", "time"}
+
+    @property
+    def write_set(self) -> set[str]:
+        return {"next_actions"}
+
     def update(self, state: GameState, delta_time: float) -> None:
-        # Run AI logic infrequently (e.g., once every 30 ticks/month)
-        tick = state.globals.get("tick", 0)
-        if tick % 30 != 0:
+        # Run AI logic infrequently: once per in-game month.
+        # We compare the TimeSystem's cached month instead of waiting for the 1st's
+        # EventNewDay, so a frame hitch that skips over that day cannot skip a month.
+        month = (state.time.year, state.time.month)
+        if self._last_month is None:
+            self._last_month = month
+            return
+        if month == self._last_month:
             return
+        self._last_month = month
 
         countries = state.get_table("countries")
         
         # Filter: Only AI countries (assuming we have a 'is_player' flag or check external map)
         # For MVP, let's assume any country with > 1B money is rich enough to build armies
-        
-        rich_countries = countries.filter(pl.col("money_reserves") > 1_000_000_000)
-        
-        for row in rich_countries.iter_rows(named=True):
-            tag = row['id']
-            
-            # Simple Logic: 50% chance to build a unit if rich
-            if random.random() > 0.5:
-                # Issue Action
-                # Note: The AI pushes actions to the NEXT tick's queue usually.
-                # However, since we are INSIDE the update loop, we can't easily append to current_actions.
-                # In a robust engine, we'd have an 'output_actions' queue.
-                # For this MVP, we will modify the state directly or use a workaround.
-                
-                # Correct way for MVP: AI actions are processed in the NEXT tick via the Session, 
-                # OR we execute the logic directly here if we want instant AI.
-                
-                # Let's simulate the AI ordering a build by directly firing the action intent 
-                # into the 'events' or just printing for now, as modifying state directly is safer here.
-                pass
\ No newline at end of file
+        candidates = (
+            countries.filter(pl.col("money_reserves") > 1_000_000_000)
+            .get_column("id")
+            .to_numpy()
+        )
+        if candidates.size == 0:
+            return
+
+        if self._rng is None:
+            self._rng = np.random.default_rng(state.globals.get("rng_seed", 0))
+
+        # Simple Logic: 50% chance to build a unit if rich (one vector draw for all countries)
+        builders = candidates[self._rng.random(candidates.size) > 0.5]
+
+        # Issue Actions
+        # We are INSIDE the update loop, so we can't append to current_actions.
+        # The orders go to 'next_actions', which the Engine feeds into the NEXT tick.
+        state.next_actions.extend(
+            ActionBuildUnit("server", country_tag=tag, unit_type="infantry", count=1)
+            for tag in builders.tolist()
+        )
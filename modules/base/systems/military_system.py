@@ -12,62 +12,78 @@ class MilitarySystem(ISystem):
     def dependencies(self) -> list[str]:
         return ["base.time","base.population", "base.economy"]
 
+    @property
+    def read_set(self) -> set[str]:
+        return {"countries", "regions", "globals"}
+
+    @property
+    def write_set(self) -> set[str]:
+        return {"countries"}
+
     def update(self, state: GameState, delta_time: float) -> None:
+        # 0. Idle Tick: no orders and no weekly manpower pass -> touch nothing
+        tick = state.globals.get("tick", 0)
+        is_manpower_tick = (tick % 7 == 0)
+        if ActionBuildUnit not in state.actions_by_type and not is_manpower_tick:
+            return
+
         # 1. Process Build Actions
-        # We filter actions to find ActionBuildUnit
-        actions_to_process = [a for a in state.current_actions if isinstance(a, ActionBuildUnit)]
+        # The Engine pre-buckets actions by type; we read them as columns
+        batch = state.get_action_batch(ActionBuildUnit)
+
+        # Both steps extend ONE lazy plan on 'countries'; it is collected at the
+        # end-of-tick write barrier together with the other systems' plans.
+        countries = state.get_table_lazy("countries")
         
-        if actions_to_process:
-            countries = state.get_table("countries")
+        if batch:
+            # Basic Logic: deduct money, add unit count
+            # In a real game, this would be complex (manpower pools, equipment, training time)
+            # For MVP: Instant build (Mock cost 1M per unit)
+            COST = 1_000_000
             
-            for action in actions_to_process:
-                # Basic Logic: deduct money, add unit count
-                # In a real game, this would be complex (manpower pools, equipment, training time)
-                # For MVP: Instant build
-                
-                # 1. Check if country exists and has money (Mock cost 1M)
-                COST = 1_000_000
-                
-                # We assume 'military_count' column exists. If not, we create/fill it.
-                if "military_count" not in countries.columns:
-                     countries = countries.with_columns(pl.lit(0).alias("military_count"))
+            # 'military_count' is guaranteed by the DataLoader's schema setup
 
-                # Apply update
-                countries = countries.with_columns(
-                    pl.when(pl.col("id") == action.country_tag)
-                    .then(pl.col("military_count") + action.count)
-                    .otherwise(pl.col("military_count"))
-                    .alias("military_count")
-                )
-                
-                # Deduct Money
-                countries = countries.with_columns(
-                    pl.when(pl.col("id") == action.country_tag)
-                    .then(pl.col("money_reserves") - (COST * action.count))
-                    .otherwise(pl.col("money_reserves"))
-                    .alias("money_reserves")
-                )
-            
-            state.update_table("countries", countries)
+            # Collapse all orders into one small frame (one row per country),
+            # so the big table is touched by a single join instead of 2 passes per action.
+            orders = pl.DataFrame({
+                "id": batch["country_tag"],
+                "_delta_units": batch["count"],
+            }).group_by("id").agg(pl.col("_delta_units").sum())
+
+            countries = (
+                countries
+                .join(orders.lazy(), on="id", how="left", maintain_order="left")
+                .with_columns([
+                    (pl.col("military_count") + pl.col("_delta_units").fill_null(0)).alias("military_count"),
+                    (pl.col("money_reserves") - pl.col("_delta_units").fill_null(0) * COST).alias("money_reserves"),
+                ])
+                .drop("_delta_units")
+            )
 
         # 2. Update Manpower based on Population (Weekly)
-        tick = state.globals.get("tick", 0)
-        if tick % 7 == 0:
-            self._update_manpower(state)
+        if is_manpower_tick:
+            countries = self._update_manpower(state, countries)
+
+        state.stage_lazy("countries", countries)
 
-    def _update_manpower(self, state: GameState):
+    def _update_manpower(self, state: GameState, countries: pl.LazyFrame) -> pl.LazyFrame:
         # Manpower is usually a % of pop_15_64
-        regions = state.get_table("regions")
-        countries = state.get_table("countries")
+        MOBILIZATION_RATE = 0.10
         
         # Aggregate eligible population by owner
-        # We group regions by 'owner' and sum 'pop_15_64'
-        pop_stats = regions.group_by("owner").agg(pl.col("pop_15_64").sum().alias("total_core_manpower"))
-        
-        # Join into countries (This is a simplified approach)
-        # In Polars, joins are fast.
-        # We simply update the 'manpower_pool' column in countries based on the region sums * 0.10 (10% mobilization)
+        # We group regions by 'owner' and sum 'pop_15_64' (10% mobilization)
+        pop_stats = (
+            state.get_table_lazy("regions")
+            .group_by("owner")
+            .agg((pl.col("pop_15_64").sum() * MOBILIZATION_RATE).cast(pl.Int64).alias("_manpower_new"))
+        )
         
-        # Note: Implementing the join back to 'countries' requires careful handling of column names 
-        # to avoid duplication. For MVP, we'll skip the complex join and assume countries table has a 'manpower' column.
-        pass
\ No newline at end of file
+        # Join into the countries plan, so Polars fuses the aggregation,
+        # join and projection without materializing 'pop_stats'.
+        # Countries without regions keep their previous pool.
+        return (
+            countries
+            .join(pop_stats, left_on="id", right_on="owner", how="left", maintain_order="left")
+            .with_columns(pl.coalesce(["_manpower_new", "manpower_pool"]).alias("manpower_pool"))
+            .drop("_manpower_new")
+        )
@@ -12,6 +12,14 @@ class PoliticsSystem(ISystem):
     def dependencies(self) -> list[str]:
         return ["base.population"] # Politics might depend on pop happiness later
 
+    @property
+    def read_set(self) -> set[str]:
+        return {"countries", "globals"}
+
+    @property
+    def write_set(self) -> set[str]:
+        return {"countries"}
+
     def update(self, state: GameState, delta_time: float) -> None:
         tick = state.globals.get("tick", 0)
         
@@ -19,7 +27,8 @@ class PoliticsSystem(ISystem):
         if tick % 7 != 0:
             return
 
-        countries = state.get_table("countries")
+        # Lazy: chained onto any plan staged earlier this tick, collected at the barrier
+        countries = state.get_table_lazy("countries")
         
         # Logic: 
         # Expected Stability = (Approval * 0.7) + (HumanDev * 0.3) - Corruption
@@ -45,4 +54,4 @@ class PoliticsSystem(ISystem):
             ).cast(pl.Int64).alias("gvt_stability")
         ).drop(["_target_stability"])
 
-        state.update_table("countries", countries)
\ No newline at end of file
+        state.stage_lazy("countries", countries)
\ No newline at end of file
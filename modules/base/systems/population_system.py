@@ -12,6 +12,14 @@ class PopulationSystem(ISystem):
     def dependencies(self) -> list[str]:
         return ["base.time"]
 
+    @property
+    def read_set(self) -> set[str]:
+        return {"regions", "events"}
+
+    @property
+    def write_set(self) -> set[str]:
+        return {"regions"}
+
     def update(self, state: GameState, delta_time: float) -> None:
         # Filter for the real-second heartbeat
         real_sec_events = [e for e in state.events if isinstance(e, EventRealSecond)]
@@ -24,7 +32,8 @@ class PopulationSystem(ISystem):
             self._apply_tfr_growth(state, days_passed)
 
     def _apply_tfr_growth(self, state: GameState, days_passed: float):
-        regions = state.get_table("regions")
+        # Lazy: several heartbeats in one tick stack into a single plan
+        regions = state.get_table_lazy("regions")
         
         # --- 2001 CONSTANTS ---
         TFR = 2.7                # Total Fertility Rate (2001 Global Avg)
@@ -63,4 +72,4 @@ class PopulationSystem(ISystem):
             (pl.col("pop_65") + pl.col("_aging_to_retirement") - pl.col("_deaths")).cast(pl.Int64).alias("pop_65")
         ])
 
-        state.update_table("regions", upd.drop(["_new_births", "_aging_to_work", "_aging_to_retirement", "_deaths"]))
\ No newline at end of file
+        state.stage_lazy("regions", upd.drop(["_new_births", "_aging_to_work", "_aging_to_retirement", "_deaths"]))
\ No newline at end of file
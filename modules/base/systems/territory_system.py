@@ -1,9 +1,11 @@
-import polars as pl
 from src.engine.interfaces import ISystem
 from src.server.state import GameState
 from src.shared.actions import ActionAnnexRegion, ActionOccupyRegion, ActionSetRegionOwner
 
 class TerritorySystem(ISystem):
+    # Every action type this system reacts to
+    ACTION_TYPES = (ActionAnnexRegion, ActionSetRegionOwner, ActionOccupyRegion)
+
     @property
     def id(self) -> str:
         return "base.territory"
@@ -12,47 +14,53 @@ class TerritorySystem(ISystem):
     def dependencies(self) -> list[str]:
         return ["base.time"]
 
+    @property
+    def read_set(self) -> set[str]:
+        return {"regions"}
+
+    @property
+    def write_set(self) -> set[str]:
+        return {"regions"}
+
     def update(self, state: GameState, delta_time: float) -> None:
         # Handle Instant Territory Changes
         # In a real game, this might take time or require a peace treaty
-        
-        relevant_actions = [
-            a for a in state.current_actions 
-            if isinstance(a, (ActionAnnexRegion, ActionSetRegionOwner, ActionOccupyRegion))
-        ]
-        
-        if not relevant_actions:
-            return
 
-        regions = state.get_table("regions")
+        # Idle Tick: buckets only exist for types that were sent, so this is a few dict probes
+        by_type = state.actions_by_type
+        if not any(action_type in by_type for action_type in self.ACTION_TYPES):
+            return
         
-        # Ensure controller column exists
-        if "controller" not in regions.columns:
-            regions = regions.with_columns(pl.col("owner").alias("controller"))
-
-        for action in relevant_actions:
-            if isinstance(action, (ActionAnnexRegion, ActionSetRegionOwner)):
-                # Change Owner AND Controller
-                regions = regions.with_columns(
-                    pl.when(pl.col("id") == action.region_id)
-                    .then(pl.lit(action.new_owner_tag))
-                    .otherwise(pl.col("owner"))
-                    .alias("owner")
-                )
-                regions = regions.with_columns(
-                    pl.when(pl.col("id") == action.region_id)
-                    .then(pl.lit(action.new_owner_tag))
-                    .otherwise(pl.col("controller"))
-                    .alias("controller")
-                )
-                
-            elif isinstance(action, ActionOccupyRegion):
-                # Change Controller Only
-                regions = regions.with_columns(
-                    pl.when(pl.col("id") == action.region_id)
-                    .then(pl.lit(action.new_controller_tag))
-                    .otherwise(pl.col("controller"))
-                    .alias("controller")
-                )
-
-        state.update_table("regions", regions)
\ No newline at end of file
+        owner_ids, owner_tags = [], []
+        ctrl_ids, ctrl_tags = [], []
+        owner_types = (ActionAnnexRegion, ActionSetRegionOwner)
+
+        if sum(action_type in by_type for action_type in self.ACTION_TYPES) > 1:
+            # Mixed tick: apply the actions in arrival order, so e.g. an annexation
+            # sent after an occupation of the same region still wins (last write wins)
+            for action in state.current_actions:
+                if isinstance(action, owner_types):
+                    # Change Owner AND Controller
+                    owner_ids.append(action.region_id)
+                    owner_tags.append(action.new_owner_tag)
+                    ctrl_ids.append(action.region_id)
+                    ctrl_tags.append(action.new_owner_tag)
+                elif isinstance(action, ActionOccupyRegion):
+                    # Change Controller Only
+                    ctrl_ids.append(action.region_id)
+                    ctrl_tags.append(action.new_controller_tag)
+        elif ActionOccupyRegion in by_type:
+            # Only occupations: read the batch as columns
+            batch = state.get_action_batch(ActionOccupyRegion)
+            ctrl_ids, ctrl_tags = batch["region_id"], batch["new_controller_tag"]
+        else:
+            # Only one kind of owner change; it also moves the controller
+            batch = state.get_action_batch(ActionAnnexRegion) or state.get_action_batch(ActionSetRegionOwner)
+            owner_ids, owner_tags = batch["region_id"], batch["new_owner_tag"]
+            ctrl_ids, ctrl_tags = owner_ids, owner_tags
+
+        # Deferred write: the GameState commits both columns in one join + coalesce
+        # pass when 'regions' is next read (or at the end of the tick).
+        # The 'controller' column is added once by the DataLoader at load time.
+        state.stage_column_update("regions", "id", owner_ids, "owner", owner_tags)
+        state.stage_column_update("regions", "id", ctrl_ids, "controller", ctrl_tags)
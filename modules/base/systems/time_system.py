@@ -1,5 +1,5 @@
 from datetime import timedelta
-from typing import List, Dict
+from typing import List, Dict, Set
 
 from src.engine.interfaces import ISystem
 from src.server.state import GameState, GAME_EPOCH
@@ -37,6 +37,12 @@ class TimeSystem(ISystem):
         self.real_sec_timer = 0.0
         self.last_event_total_minutes = 0
 
+        # Calendar cache: the date only changes once per 1440 minutes,
+        # so the datetime math and the "YYYY-MM-DD" prefix are rebuilt on rollover only.
+        self._epoch_date = GAME_EPOCH.date()
+        self._cached_day_index = -1
+        self._cached_date_prefix = ""
+
     @property
     def id(self) -> str:
         return "base.time"
@@ -46,19 +52,26 @@ class TimeSystem(ISystem):
         # Time has no dependencies on other gameplay systems.
         return []
 
+    @property
+    def read_set(self) -> Set[str]:
+        return {"time"}
+
+    @property
+    def write_set(self) -> Set[str]:
+        return {"time", "globals", "events"}
+
     def update(self, state: GameState, delta_time: float) -> None:
         t = state.time
 
         # 1. Handle Control Actions
-        # We iterate through actions to see if speed was changed this tick
-        for action in state.current_actions:
-            if isinstance(action, ActionSetGameSpeed):
-                # Clamp speed between 1 and 5
-                t.speed_level = max(1, min(5, action.speed_level))
-                state.globals["game_speed"] = t.speed_level
-            
-            elif isinstance(action, ActionSetPaused):
-                t.is_paused = action.is_paused
+        # Only the control buckets are read; the Engine pre-sorts actions by type.
+        for action in state.actions_by_type.get(ActionSetGameSpeed, ()):
+            # Clamp speed between 1 and 5
+            t.speed_level = max(1, min(5, action.speed_level))
+            state.globals["game_speed"] = t.speed_level
+
+        for action in state.actions_by_type.get(ActionSetPaused, ()):
+            t.is_paused = action.is_paused
 
         # 2. Real Second Heartbeat
         # We process this BEFORE the pause check so the heartbeat continues
@@ -89,37 +102,48 @@ class TimeSystem(ISystem):
         rate = self.minutes_per_sec.get(t.speed_level, 120.0)
         
         # Accumulate fractional minutes
-        t._accumulator += delta_time * rate
+        # Work on locals and write back once: this step is O(1) per frame no matter
+        # how many minutes pass, so even speed 5 costs a single divmod, not a loop.
+        acc = t._accumulator + delta_time * rate
         
         # 5. Integer Step Logic
         # We only update the simulation if at least 1 in-game minute has passed.
-        if t._accumulator >= 1.0:
-            minutes_delta = int(t._accumulator)
-            t.total_minutes += minutes_delta
-            t._accumulator -= minutes_delta  # Keep the remainder
-            
-            # --- Temporal Update & Signaling ---
-            
-            # Snapshot previous values to detect changes
-            prev_hour = t.hour
-            prev_day = t.day
-            
-            # Recalculate human-readable fields using Python's robust datetime logic
-            current_dt = GAME_EPOCH + timedelta(minutes=t.total_minutes)
-            
-            # Update optimized integers
-            t.year = current_dt.year
-            t.month = current_dt.month
-            t.day = current_dt.day
-            t.hour = current_dt.hour
-            t.minute = current_dt.minute
-            
-            # Update UI string
-            t.date_str = current_dt.strftime("%Y-%m-%d %H:%M")
+        if acc < 1.0:
+            t._accumulator = acc
+            return
+
+        minutes_delta = int(acc)
+        t._accumulator = acc - minutes_delta  # Keep the remainder
+        total_minutes = t.total_minutes + minutes_delta
+        t.total_minutes = total_minutes
+
+        # --- Temporal Update & Signaling ---
+        
+        # Snapshot previous values to detect changes
+        prev_hour = t.hour
+        prev_day = t.day
+        
+        # Recalculate human-readable fields.
+        # Hour/minute are pure integer math; the calendar date is cached per day.
+        day_index, minute_of_day = divmod(total_minutes, 1440)
+        if day_index != self._cached_day_index:
+            current_date = self._epoch_date + timedelta(days=day_index)
+            t.year = current_date.year
+            t.month = current_date.month
+            t.day = current_date.day
+            self._cached_day_index = day_index
+            self._cached_date_prefix = f"{t.year:04d}-{t.month:02d}-{t.day:02d}"
+
+        hour, minute = divmod(minute_of_day, 60)
+        t.hour = hour
+        t.minute = minute
+        
+        # Update UI string
+        t.date_str = f"{self._cached_date_prefix} {hour:02d}:{minute:02d}"
+        
+        # 6. Emit Temporal Events
+        if hour != prev_hour:
+            state.events.append(EventNewHour(hour, total_minutes))
             
-            # 6. Emit Temporal Events
-            if t.hour != prev_hour:
-                state.events.append(EventNewHour(t.hour, t.total_minutes))
-                
-            if t.day != prev_day:
-                state.events.append(EventNewDay(t.day, t.month, t.year))
\ No newline at end of file
+        if t.day != prev_day:
+            state.events.append(EventNewDay(t.day, t.month, t.year))
\ No newline at end of file
@@ -1,5 +1,4 @@
 import arcade
-from pyglet.math import Vec2
 
 class CameraController:
     """
@@ -11,25 +10,35 @@ class CameraController:
         self.MIN_ZOOM = 0.1
         self.MAX_ZOOM = 5.0
 
-        self.position = Vec2(start_pos[0], start_pos[1])
+        # Position is kept as two raw floats; a vector is only built at the
+        # render boundary (sync_with_arcade), never per input event.
+        self.pos_x = float(start_pos[0])
+        self.pos_y = float(start_pos[1])
         self.zoom = 1.0
+        # Cached 1/zoom: input events fire far more often than the zoom changes
+        self._inv_zoom = 1.0
+
+    @property
+    def position(self) -> tuple[float, float]:
+        return self.pos_x, self.pos_y
 
     def pan(self, dx: float, dy: float):
         """Moves camera based on screen-space drag deltas."""
-        scale_factor = 1.0 / self.zoom
         # Invert direction: Dragging RIGHT moves camera LEFT
-        movement = Vec2(dx, dy) * scale_factor
-        self.position -= movement
+        self.pos_x -= dx * self._inv_zoom
+        self.pos_y -= dy * self._inv_zoom
 
     def zoom_scroll(self, scroll_y: int):
         direction = 1.0 if scroll_y > 0 else -1.0
         self.zoom += direction * self.ZOOM_SPEED
         self.zoom = max(self.MIN_ZOOM, min(self.zoom, self.MAX_ZOOM))
+        self._inv_zoom = 1.0 / self.zoom
 
     def jump_to(self, x: float, y: float):
-        self.position = Vec2(x, y)
+        self.pos_x = float(x)
+        self.pos_y = float(y)
 
     def sync_with_arcade(self, camera: arcade.Camera2D):
         """Applies internal state to the renderer's camera."""
-        camera.position = self.position
-        camera.zoom = self.zoom
\ No newline at end of file
+        camera.position = (self.pos_x, self.pos_y)
+        camera.zoom = self.zoom
@@ -1,6 +1,7 @@
 import arcade
+import numpy as np
 import polars as pl
-from typing import Optional, Callable, Dict
+from typing import Optional, Callable, Dict, Tuple
 from enum import Enum, auto
 
 from src.client.controllers.camera_controller import CameraController
@@ -71,6 +72,14 @@ class ViewportController:
         }
         self.current_mode_key = "political"
 
+        # Owner -> GPU group id, so COUNTRY selection is a single shader uniform.
+        # Rebuilt only when the id or owner column of 'regions' changes.
+        self._owner_groups: Dict[str, int] = {}
+        self._groups_source: Optional[pl.DataFrame] = None
+        # (id, owner) columns the groups were built from; a new 'regions' frame
+        # with the same columns (e.g. a population tick) keeps the uploaded groups
+        self._groups_columns: Optional[Tuple[pl.Series, pl.Series]] = None
+
     def set_selection_mode(self, mode: SelectionMode):
         self.selection_mode = mode
         self.renderer.clear_highlight()
@@ -95,10 +104,32 @@ class ViewportController:
         active_mode = self.map_modes[self.current_mode_key]
 
         # 1. Execute Strategy (Pure Data Transformation)
-        color_map = active_mode.calculate_colors(state)
+        ids, rgb = active_mode.calculate_colors(state)
 
         # 2. Update Renderer (Pure Visualization)
-        self.renderer.update_overlay(color_map)
+        self.renderer.update_overlay_arrays(ids, rgb)
+        self._sync_owner_groups(state)
+
+    def _sync_owner_groups(self, state):
+        """Pushes one group id per owner to the renderer if 'regions' changed."""
+        regions = state.tables.get("regions")
+        if regions is None or regions is self._groups_source or "owner" not in regions.columns:
+            return
+
+        ids = regions.get_column("id")
+        owner_col = regions.get_column("owner")
+        self._groups_source = regions
+        if self._groups_columns is not None:
+            old_ids, old_owners = self._groups_columns
+            if old_ids.equals(ids) and old_owners.equals(owner_col):
+                return
+        self._groups_columns = (ids, owner_col)
+
+        owners = owner_col.fill_null("None").to_numpy()
+        tags, inverse = np.unique(owners, return_inverse=True)
+
+        self._owner_groups = {tag: i + 1 for i, tag in enumerate(tags.tolist())}
+        self.renderer.update_region_groups(ids.to_numpy(), inverse + 1)
 
     # Legacy alias for compatibility with older Views, routed to new logic
     def refresh_political_layer(self):
@@ -108,12 +139,11 @@ class ViewportController:
         state = self.net.get_state()
         if "regions" not in state.tables: return
 
-        df = state.tables["regions"]
-        row = df.filter(pl.col("id") == region_id)
+        row = state.lookup_region(region_id)
 
-        if not row.is_empty():
-            cx = row["center_x"][0]
-            cy = row["center_y"][0]
+        if row is not None:
+            cx = row["center_x"]
+            cy = row["center_y"]
 
             # Convert to World Space
             wx, wy = image_to_world(cx, cy, self.renderer.height)
@@ -161,14 +191,21 @@ class ViewportController:
         if self.selection_mode == SelectionMode.COUNTRY:
             state = self.net.get_state()
             if "regions" in state.tables:
-                df = state.tables["regions"]
-                # Find owner of clicked region
-                owner_rows = df.filter(pl.col("id") == region_id)
-                if not owner_rows.is_empty():
-                    owner = owner_rows["owner"][0]
+                # Find owner of clicked region (hash index, no table scan)
+                clicked = state.lookup_region(region_id)
+                if clicked is not None:
+                    owner = clicked["owner"]
                     if owner and owner != "None":
-                        # Get ALL regions by this owner for multi-select
-                        highlight_ids = df.filter(pl.col("owner") == owner)["id"].to_list()
+                        # Highlight ALL regions of this owner with one uniform
+                        self._sync_owner_groups(state)
+                        group = self._owner_groups.get(owner)
+                        if group is not None:
+                            self.renderer.set_highlight_group(group)
+                            self.on_selection_change(region_id)
+                            return
+
+                        # Fallback: explicit multi-select (inverted index)
+                        highlight_ids = state.get_region_ids_by_owner(owner)
 
         self.renderer.set_highlight(highlight_ids)
         self.on_selection_change(region_id)
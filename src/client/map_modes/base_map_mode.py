@@ -1,3 +1,4 @@
+import numpy as np
 from abc import ABC, abstractmethod
 from typing import Dict, Tuple
 from src.server.state import GameState
@@ -5,7 +6,7 @@ from src.server.state import GameState
 class BaseMapMode(ABC):
     """
     Strategy interface for coloring the map.
-    Returns a mapping of Region ID -> RGB Color.
+    Returns Region IDs and their RGB Colors as parallel arrays (Struct of Arrays).
     """
 
     @property
@@ -14,10 +15,24 @@ class BaseMapMode(ABC):
         pass
 
     @abstractmethod
-    def calculate_colors(self, state: GameState) -> Dict[int, Tuple[int, int, int]]:
+    def calculate_colors(self, state: GameState) -> Tuple[np.ndarray, np.ndarray]:
         """
         Pure data transformation.
         Input: State (Polars DataFrames)
-        Output: Dictionary mapping Region Real IDs to Tuple (R, G, B)
+        Output: (ids, rgb) where 'ids' is an (N,) array of Region Real IDs
+                and 'rgb' is an (N, 3) uint8 array of colors.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def calculate_color_dict(self, state: GameState) -> Dict[int, Tuple[int, int, int]]:
+        """
+        Legacy adapter: Region Real ID -> (R, G, B).
+        Prefer calculate_colors() on hot paths.
+        """
+        ids, rgb = self.calculate_colors(state)
+        return dict(zip(ids.tolist(), map(tuple, rgb.tolist())))
+
+    @staticmethod
+    def empty_colors() -> Tuple[np.ndarray, np.ndarray]:
+        """Result for modes that have nothing to draw."""
+        return np.empty(0, dtype=np.int64), np.empty((0, 3), dtype=np.uint8)
@@ -1,9 +1,9 @@
 import polars as pl
-import math
-from typing import Dict, Tuple
+import numpy as np
+from typing import Tuple
 from src.server.state import GameState
 from src.client.map_modes.base_map_mode import BaseMapMode
-from src.client.utils.gradient import get_heatmap_color, lerp_color
+from src.client.utils.gradient import get_heatmap_colors
 
 
 class GradientMapMode(BaseMapMode):
@@ -28,8 +28,8 @@ class GradientMapMode(BaseMapMode):
     def merge_borders(self) -> bool:
         return self.fallback_to_country
 
-    def calculate_colors(self, state: GameState) -> Dict[int, Tuple[int, int, int]]:
-        if "regions" not in state.tables: return {}
+    def calculate_colors(self, state: GameState) -> Tuple[np.ndarray, np.ndarray]:
+        if "regions" not in state.tables: return self.empty_colors()
 
         regions_df = state.get_table("regions")
         target_col = self.column_name
@@ -49,7 +49,7 @@ class GradientMapMode(BaseMapMode):
                     how="left"
                 ).select(["id", target_col])
 
-        if work_df is None: return {}
+        if work_df is None: return self.empty_colors()
 
         # 2. Filter valid data
         # We need to compute ranks on the *unique values* first to handle ties correctly?
@@ -57,7 +57,7 @@ class GradientMapMode(BaseMapMode):
 
         # Drop nulls for calculation safety
         valid_df = work_df.drop_nulls(subset=[target_col])
-        if valid_df.is_empty(): return {}
+        if valid_df.is_empty(): return self.empty_colors()
 
         # --- KEY FIX: PERCENTILE CALCULATION ---
         if self.use_percentile:
@@ -87,23 +87,20 @@ class GradientMapMode(BaseMapMode):
             max_val = valid_df.select(pl.col(target_col).max()).item()
             if max_val == min_val: max_val = min_val + 1.0
 
-        # 3. Generate Colors
-        result = {}
-        for row in work_df.iter_rows(named=True):
-            rid = row["id"]
-            val = row[value_col]
+        # 3. Generate Colors (Vectorized)
+        # Nulls become NaN in the float array and are stamped grey afterwards.
+        ids = work_df.get_column("id").to_numpy()
+        values = work_df.get_column(value_col).cast(pl.Float64).to_numpy()
+        missing = np.isnan(values)
 
-            if val is None:
-                result[rid] = (40, 40, 40)  # Grey
-                continue
+        t = (values - min_val) / (max_val - min_val)
 
-            t = (float(val) - min_val) / (max_val - min_val)
+        # --- OPTIONAL: QUANTIZE INTO GROUPS ---
+        # If steps=5, t becomes 0.0, 0.2, 0.4, 0.6, 0.8, 1.0
+        if self.steps > 1:
+            t = np.floor(t * self.steps) / self.steps
 
-            # --- OPTIONAL: QUANTIZE INTO GROUPS ---
-            # If steps=5, t becomes 0.0, 0.2, 0.4, 0.6, 0.8, 1.0
-            if self.steps > 1:
-                t = math.floor(t * self.steps) / self.steps
+        rgb = get_heatmap_colors(t)
+        rgb[missing] = (40, 40, 40)  # Grey
 
-            result[rid] = get_heatmap_color(t)
-
-        return result
\ No newline at end of file
+        return ids, rgb
@@ -1,4 +1,6 @@
-from typing import Dict, Tuple
+import numpy as np
+import polars as pl
+from typing import Tuple
 from src.server.state import GameState
 from src.client.map_modes.base_map_mode import BaseMapMode
 from src.client.utils.color_generator import generate_political_colors
@@ -8,33 +10,29 @@ class PoliticalMapMode(BaseMapMode):
     def name(self) -> str:
         return "Political"
 
-    def calculate_colors(self, state: GameState) -> Dict[int, Tuple[int, int, int]]:
+    def calculate_colors(self, state: GameState) -> Tuple[np.ndarray, np.ndarray]:
         if "regions" not in state.tables:
-            return {}
+            return self.empty_colors()
 
         df = state.get_table("regions")
         if "owner" not in df.columns:
-            return {}
+            return self.empty_colors()
+
+        # Unowned regions share the "None" tag (generate_political_colors paints it black)
+        owners = df.get_column("owner").cast(pl.String).fill_null("None")
 
         # 1. Get unique owners to generate consistent palette
-        unique_owners = df["owner"].unique().to_list()
+        unique_owners = owners.unique().to_list()
 
-        # 2. Generate Palette: {CountryTag: RGB}
+        # 2. Generate Palette: {CountryTag: RGB} -> (K, 3) array
         palette = generate_political_colors(unique_owners)
+        palette_rgb = np.array([palette[tag] for tag in unique_owners], dtype=np.uint8).reshape(-1, 3)
 
         # 3. Map Regions to Colors
-        # Using Polars to map implies creating a join, but for simplicity/speed
-        # with dictionaries in Python:
-
-        # Pull only necessary columns
-        rows = df.select(["id", "owner"]).to_dicts()
-
-        result = {}
-        for row in rows:
-            rid = row["id"]
-            owner = row["owner"]
-            # Default to dark grey for unowned/None
-            color = palette.get(owner, (50, 50, 50))
-            result[rid] = color
+        # Every owner is in the palette, so a strict replace yields a palette index per row.
+        owner_idx = owners.replace_strict(
+            unique_owners, list(range(len(unique_owners))), return_dtype=pl.UInt32
+        ).to_numpy()
 
-        return result
\ No newline at end of file
+        ids = df.get_column("id").to_numpy()
+        return ids, palette_rgb[owner_idx]
@@ -24,10 +24,18 @@ class BaseRenderer(ABC):
             pass
     
     def _enable_rendering_state(self) -> None:
-        """Enable common OpenGL rendering state."""
-        self.ctx.enable(self.ctx.DEPTH_TEST)
-        self.ctx.enable(self.ctx.BLEND)
-        self.ctx.blend_func = self.ctx.BLEND_DEFAULT
+        """
+        Enable common OpenGL rendering state.
+        The context tracks the flags and blend function it set, so GL calls are
+        only issued on an actual transition (usually just DEPTH_TEST per frame).
+        """
+        ctx = self.ctx
+        if not ctx.is_enabled(ctx.DEPTH_TEST):
+            ctx.enable(ctx.DEPTH_TEST)
+        if not ctx.is_enabled(ctx.BLEND):
+            ctx.enable(ctx.BLEND)
+        if ctx.blend_func != ctx.BLEND_DEFAULT:
+            ctx.blend_func = ctx.BLEND_DEFAULT
     
     def _disable_rendering_state(self) -> None:
         """Disable common OpenGL rendering state."""
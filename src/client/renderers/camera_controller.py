@@ -2,7 +2,7 @@ import numpy as np
 from typing import Tuple, Optional
 
 
-class CameraController:
+class GlobeCameraController:
     """Manages camera controls including rotation, zoom, and matrix calculations."""
     
     def __init__(
@@ -47,6 +47,12 @@ class CameraController:
         # Cached matrices for picking
         self._u_vp_np: Optional[np.ndarray] = None
         self._u_model_np: Optional[np.ndarray] = None
+        # Inverses for picking: computed on first use, kept until the matrices change
+        self._inv_vp_np: Optional[np.ndarray] = None
+        self._inv_model_np: Optional[np.ndarray] = None
+        
+        # Inputs the current matrices were built from; unchanged inputs skip the rebuild
+        self._matrix_key: Optional[tuple] = None
     
     def update_matrices(self, window_width: int, window_height: int) -> None:
         """Update all camera matrices based on current state."""
@@ -57,6 +63,13 @@ class CameraController:
         # Clamp pitch to avoid flipping at poles
         self.pitch = float(np.clip(self.pitch, -self.max_pitch, self.max_pitch))
         
+        # Idle camera (and the extra call made by picking): the matrices, their
+        # picking copies and the cached inverses are all still valid.
+        key = (self.yaw, self.pitch, self.distance, self.fov_deg, window_width, window_height)
+        if key == self._matrix_key:
+            return
+        self._matrix_key = key
+        
         # Model matrix: only static base orientation for the globe mesh/UV alignment.
         # User interaction is applied via the VIEW (orbit camera) to keep roll locked
         # and avoid awkward gimbal behavior from chaining model rotations.
@@ -76,6 +89,8 @@ class CameraController:
         vp = self._u_proj @ self._u_view
         self._u_vp_np = np.ascontiguousarray(vp, dtype=np.float32)
         self._u_model_np = np.ascontiguousarray(self._u_model, dtype=np.float32)
+        self._inv_vp_np = None
+        self._inv_model_np = None
     
     def get_matrices(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Get model, view, and projection matrices as tuple-major tuples."""
@@ -89,6 +104,22 @@ class CameraController:
         """Get cached view-projection and model matrices for picking."""
         return self._u_vp_np, self._u_model_np
     
+    def get_inverse_matrices(self) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        Get inverse view-projection and model matrices for picking.
+        Inverted once per camera change and reused by every pick until then;
+        (None, None) if the matrices are missing or singular.
+        """
+        if self._inv_vp_np is None:
+            if self._u_vp_np is None or self._u_model_np is None:
+                return None, None
+            try:
+                self._inv_vp_np = np.linalg.inv(self._u_vp_np)
+                self._inv_model_np = np.linalg.inv(self._u_model_np)
+            except np.linalg.LinAlgError:
+                return None, None
+        return self._inv_vp_np, self._inv_model_np
+    
     def get_position(self) -> tuple[float, float, float]:
         """Get current camera position in world space."""
         # Calculate position from spherical coordinates
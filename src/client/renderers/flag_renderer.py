@@ -1,21 +1,111 @@
 import arcade
 import arcade.gl
 import ctypes
+import io
+import os
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Tuple, Iterable, List, Callable
 from PIL import Image
 from imgui_bundle import imgui
 
+# src/client/renderers/flag_renderer.py -> project root (resolved once at import)
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+FLAGS_DIR = PROJECT_ROOT / "modules" / "base" / "assets" / "flags"
+
+# Atlas cell size. Flags are drawn at roughly 80x53 px, so the shipped 450x300
+# assets are downscaled to 3:2 cells with headroom for HiDPI scaling
+# (about 15 MB of VRAM for 250 flags instead of 136 MB at full size).
+FLAG_CELL_SIZE: Tuple[int, int] = (150, 100)
+
+# Gutter around every cell, filled with the flag's edge pixels, so LINEAR
+# filtering at a flag's border never samples a neighbouring flag
+FLAG_CELL_PADDING = 1
+
 class FlagTexture:
     """
     Wrapper to hold both the GL Object (to prevent Garbage Collection) 
     and the ID for ImGui.
+    For atlas entries, 'uv0'/'uv1' select the flag's cell inside the shared texture.
     """
-    def __init__(self, gl_obj: Any, gl_id: int, width: int, height: int):
+    def __init__(self, gl_obj: Any, gl_id: int, width: int, height: int,
+                 uv0: Tuple[float, float] = (0.0, 0.0), uv1: Tuple[float, float] = (1.0, 1.0),
+                 slot: Optional[int] = None):
         self.gl_obj = gl_obj  # CRITICAL: Holding this prevents the GPU from deleting the texture
         self.gl_id = gl_id
         self.width = width
         self.height = height
+        self.uv0 = uv0
+        self.uv1 = uv1
+        self.slot = slot  # Atlas cell index, None for a standalone texture
+
+class FlagAtlas:
+    """
+    Fixed-grid texture atlas: every flag gets one cell of the same size inside
+    a single GL texture, so ImGui draws all flags from one texture binding.
+    """
+    def __init__(self, ctx: arcade.gl.Context, capacity: int, cell_size: Tuple[int, int] = FLAG_CELL_SIZE):
+        # Cell stride includes the gutter on both sides
+        self.cell_w = cell_size[0] + 2 * FLAG_CELL_PADDING
+        self.cell_h = cell_size[1] + 2 * FLAG_CELL_PADDING
+        max_size = ctx.info.MAX_TEXTURE_SIZE
+        
+        self.cols = max(1, min(capacity, max_size // self.cell_w))
+        self.rows = max(1, min(-(-capacity // self.cols), max_size // self.cell_h))
+        self.capacity = self.cols * self.rows
+        self.width = self.cols * self.cell_w
+        self.height = self.rows * self.cell_h
+
+        self.texture = ctx.texture((self.width, self.height), components=4)
+        self.texture.filter = (ctx.LINEAR, ctx.LINEAR)
+        self._next_slot = 0
+        self._free_slots: List[int] = []
+
+    def add(self, pixels: np.ndarray) -> Optional[Tuple[int, Tuple[float, float], Tuple[float, float]]]:
+        """Copies an (H, W, 4) uint8 flag into a free cell. Returns (slot, uv0, uv1) or None if full."""
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        elif self._next_slot < self.capacity:
+            slot = self._next_slot
+            self._next_slot += 1
+        else:
+            return None
+        try:
+            uv0, uv1 = self.write(slot, pixels)
+        except Exception:
+            # A failed upload must not leak the cell
+            self.release(slot)
+            raise
+        return slot, uv0, uv1
+
+    def release(self, slot: int):
+        """Marks a cell as reusable by a later add()."""
+        self._free_slots.append(slot)
+
+    def write(self, slot: int, pixels: np.ndarray) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+        h, w = pixels.shape[:2]
+        x = (slot % self.cols) * self.cell_w
+        y = (slot // self.cols) * self.cell_h
+
+        # The gutter repeats the edge pixels (np.pad returns a new writable array)
+        pad = FLAG_CELL_PADDING
+        padded = np.pad(pixels, ((pad, pad), (pad, pad), (0, 0)), mode="edge")
+        self.texture.write(memoryview(padded), viewport=(x, y, w + 2 * pad, h + 2 * pad))
+
+        # UVs cover the flag only, not its gutter.
+        # Texture row 0 is the first uploaded row, which ImGui shows at the top (v = 0)
+        x += pad
+        y += pad
+        uv0 = (x / self.width, y / self.height)
+        uv1 = ((x + w) / self.width, (y + h) / self.height)
+        return uv0, uv1
+
+    def reset(self):
+        """Forgets every cell (texture memory is reused by later writes)."""
+        self._next_slot = 0
+        self._free_slots.clear()
 
 class FlagRenderer:
     """
@@ -34,18 +124,21 @@ class FlagRenderer:
     def __init__(self):
         if self._initialized: return
         
-        current_path = Path(__file__).resolve()
-        self.project_root = current_path
-        # Traverse up to find the root
-        for parent in current_path.parents:
-            if (parent / "modules").exists():
-                self.project_root = parent
-                break
-        
-        self.flags_dir = self.project_root / "modules" / "base" / "assets" / "flags"
-        self._cache: Dict[str, Optional[FlagTexture]] = {}
+        self.project_root = PROJECT_ROOT
+        self.flags_dir = FLAGS_DIR
+        # LRU order: most recently used tag last. Bounded by the atlas: entries
+        # are only evicted when a new flag needs a cell (see _add_to_atlas).
+        self._cache: "OrderedDict[str, FlagTexture]" = OrderedDict()
+        # Cache entries per texture (tags without a flag share the fallback's),
+        # so eviction knows in O(1) when a texture is no longer referenced
+        self._refcount: Dict[int, int] = {}
+        self._atlas: Optional[FlagAtlas] = None # Created on first load (needs a GL context)
         self._fallback_tag = "XXX"
         self._error_printed = False # To prevent console spam on rendering failures
+
+        # Binding probes: resolved by the first successful call, then reused directly
+        self._image_cast: Optional[Callable[[int], Any]] = None
+        self._gl_id_getter: Optional[Callable[[Any], int]] = None
         self._initialized = True
         
         self._emergency_texture = self._create_emergency_texture()
@@ -63,22 +156,31 @@ class FlagRenderer:
             imgui.dummy(imgui.ImVec2(width, height))
             return
 
-        self._render_imgui_image(texture.gl_id, width, height)
+        self._render_imgui_image(texture.gl_id, width, height, texture.uv0, texture.uv1)
 
-    def _render_imgui_image(self, gl_id: int, w: float, h: float):
+    def _render_imgui_image(self, gl_id: int, w: float, h: float,
+                            uv0: Tuple[float, float] = (0.0, 0.0), uv1: Tuple[float, float] = (1.0, 1.0)):
         """
         Internal helper: Attempts to render an image using multiple ImGui type casting strategies.
         This is necessary because imgui_bundle bindings can vary regarding how they accept
         raw OpenGL texture IDs (int vs ImTextureID vs ImTextureRef).
         """
         size = imgui.ImVec2(w, h)
+        uv0 = imgui.ImVec2(*uv0)
+        uv1 = imgui.ImVec2(*uv1)
+
+        # Fast path: the cast that worked last time (bindings do not change at runtime)
+        if self._image_cast is not None:
+            imgui.image(self._image_cast(gl_id), size, uv0, uv1)
+            return
         
         # ATTEMPT 1: Strict Binding Cast (ImTextureRef)
         # Some bindings require a specific reference object wrapper.
         try:
             if hasattr(imgui, "ImTextureRef"):
                 tex_ref = imgui.ImTextureRef(gl_id) 
-                imgui.image(tex_ref, size)
+                imgui.image(tex_ref, size, uv0, uv1)
+                self._image_cast = imgui.ImTextureRef
                 return
         except Exception:
             pass
@@ -87,7 +189,8 @@ class FlagRenderer:
         try:
             if hasattr(imgui, "ImTextureID"):
                 tex_id = imgui.ImTextureID(gl_id)
-                imgui.image(tex_id, size)
+                imgui.image(tex_id, size, uv0, uv1)
+                self._image_cast = imgui.ImTextureID
                 return
         except Exception:
             pass
@@ -95,7 +198,8 @@ class FlagRenderer:
         # ATTEMPT 3: Standard Int (Python dynamic typing)
         # Sometimes the bindings are smart enough to take a raw int.
         try:
-            imgui.image(gl_id, size)
+            imgui.image(gl_id, size, uv0, uv1)
+            self._image_cast = int
             return
         except TypeError:
             pass
@@ -104,7 +208,8 @@ class FlagRenderer:
         # The lowest level approach: passing a raw C pointer.
         try:
             ptr = ctypes.c_void_p(gl_id)
-            imgui.image(ptr, size)
+            imgui.image(ptr, size, uv0, uv1)
+            self._image_cast = ctypes.c_void_p
             return
         except TypeError:
             pass
@@ -120,81 +225,218 @@ class FlagRenderer:
     def _create_emergency_texture(self) -> Optional[FlagTexture]:
         """Creates a magenta square for missing assets."""
         try:
-            img = Image.new('RGBA', (32, 32), (255, 0, 255, 255))
-            return self._upload_to_gpu(img, "EMERGENCY")
+            pixels = np.full((32, 32, 4), (255, 0, 255, 255), dtype=np.uint8)
+            return self._upload_to_gpu(pixels, "EMERGENCY")
         except Exception:
             return None
 
-    def _upload_to_gpu(self, image: Image.Image, label: str) -> Optional[FlagTexture]:
+    def _upload_to_gpu(self, pixels: np.ndarray, label: str) -> Optional[FlagTexture]:
         """
-        Uploads PIL image and returns a wrapper that PROTECTS the texture from GC.
+        Uploads an (H, W, 4) uint8 RGBA array and returns a wrapper that PROTECTS the texture from GC.
         """
         try:
             window = arcade.get_window()
             ctx = window.ctx
+            height, width = pixels.shape[:2]
             
-            # 1. Create Texture
+            # 1. Create Texture (buffer protocol, no extra bytes copy)
             gl_texture = ctx.texture(
-                (image.width, image.height),
+                (width, height),
                 components=4,
-                data=image.tobytes()
+                data=memoryview(np.ascontiguousarray(pixels))
             )
             
             # 2. Configure for ImGui (No Mipmaps for crisp pixel art flags)
             gl_texture.filter = (ctx.LINEAR, ctx.LINEAR)
             
             # 3. Extract ID robustly (handle different Arcade versions)
-            raw_glo = getattr(gl_texture, "glo", None)
-            tex_id = 0
-            
-            if raw_glo is not None:
-                if hasattr(raw_glo, "glo_id"): 
-                    tex_id = int(raw_glo.glo_id)
-                elif hasattr(raw_glo, "value"): 
-                    tex_id = int(raw_glo.value)
-                else:
-                    tex_id = int(raw_glo)
-
+            tex_id = self._get_gl_id(gl_texture)
             if tex_id == 0:
                 return None
             
             # Return wrapper to keep gl_texture alive in self._cache
-            return FlagTexture(gl_texture, tex_id, image.width, image.height)
+            return FlagTexture(gl_texture, tex_id, width, height)
 
         except Exception as e:
             print(f"[FlagRenderer] GPU Upload Error ({label}): {e}")
             return None
 
+    def _get_gl_id(self, gl_texture: Any) -> int:
+        """GL texture name of an arcade texture. The attribute layout is probed once."""
+        if self._gl_id_getter is None:
+            raw_glo = getattr(gl_texture, "glo", None)
+            if raw_glo is None:
+                return 0
+            if hasattr(raw_glo, "glo_id"): 
+                self._gl_id_getter = lambda t: int(t.glo.glo_id)
+            elif hasattr(raw_glo, "value"): 
+                self._gl_id_getter = lambda t: int(t.glo.value)
+            else:
+                self._gl_id_getter = lambda t: int(t.glo)
+        return self._gl_id_getter(gl_texture)
+
+    def _get_atlas(self) -> Optional[FlagAtlas]:
+        """Creates the shared atlas on first use, sized for every flag on disk."""
+        if self._atlas is None:
+            try:
+                capacity = max(1, sum(1 for _ in self.flags_dir.glob("*.png")))
+                self._atlas = FlagAtlas(arcade.get_window().ctx, capacity)
+                print(f"[FlagRenderer] Atlas {self._atlas.width}x{self._atlas.height} ({self._atlas.capacity} cells)")
+            except Exception as e:
+                print(f"[FlagRenderer] Atlas creation failed: {e}")
+                return None
+        return self._atlas
+
+    def _add_to_atlas(self, pixels: np.ndarray, label: str) -> Optional[FlagTexture]:
+        """Places a flag in the shared atlas; falls back to its own texture if the atlas is full."""
+        atlas = self._get_atlas()
+        if atlas is not None:
+            placed = atlas.add(pixels)
+            # Full: recycle the cells of the least recently used flags
+            while placed is None and self._cache:
+                self._evict_oldest()
+                placed = atlas.add(pixels)
+
+            tex_id = self._get_gl_id(atlas.texture)
+            if placed is not None and tex_id != 0:
+                slot, uv0, uv1 = placed
+                height, width = pixels.shape[:2]
+                return FlagTexture(atlas.texture, tex_id, width, height, uv0, uv1, slot)
+        return self._upload_to_gpu(pixels, label)
+
+    def _cache_put(self, tag: str, texture: FlagTexture):
+        previous = self._cache.get(tag)
+        if previous is texture:
+            self._cache.move_to_end(tag)
+            return
+        if previous is not None:
+            self._refcount[id(previous)] -= 1
+        self._cache[tag] = texture
+        self._cache.move_to_end(tag)
+        self._refcount[id(texture)] = self._refcount.get(id(texture), 0) + 1
+
+    def _evict_oldest(self):
+        """Drops the least recently used entry and frees its GPU storage if nothing else uses it."""
+        _, texture = self._cache.popitem(last=False)
+        # Tags without a flag share the fallback entry; keep it while still referenced
+        remaining = self._refcount.pop(id(texture), 1) - 1
+        if remaining > 0:
+            self._refcount[id(texture)] = remaining
+            return
+        if texture is self._emergency_texture:
+            return
+
+        if texture.slot is not None and self._atlas is not None and texture.gl_obj is self._atlas.texture:
+            self._atlas.release(texture.slot)
+        else:
+            try:
+                texture.gl_obj.delete()
+            except Exception as e:
+                print(f"[FlagRenderer] Texture release failed: {e}")
+
     def get_texture(self, tag: str) -> Optional[FlagTexture]:
         """Retrieves a texture from cache or loads it from disk."""
-        if tag in self._cache:
-            return self._cache[tag]
+        texture = self._cache.get(tag)
+        if texture is not None:
+            self._cache.move_to_end(tag)
+            return texture
 
         clean_tag = tag.strip()
-        flag_path = self.flags_dir / f"{clean_tag}.png"
+        flag_path = self._resolve_flag_path(clean_tag)
         
-        # Try exact match, then lowercase, then fallback
-        if not flag_path.exists():
-            lower_path = self.flags_dir / f"{clean_tag.lower()}.png"
-            if lower_path.exists(): 
-                flag_path = lower_path
-            else: 
-                flag_path = self.flags_dir / f"{self._fallback_tag}.png"
-
-        if not flag_path.exists():
+        if flag_path is None and clean_tag != self._fallback_tag:
+            # Share the fallback flag's atlas cell instead of copying it per tag
+            texture = self.get_texture(self._fallback_tag)
+            if texture is not self._emergency_texture:
+                self._cache_put(tag, texture)
+            return texture
+
+        if flag_path is None:
             return self._emergency_texture
 
         try:
-            with Image.open(flag_path) as img:
-                img = img.convert("RGBA")
-                texture = self._upload_to_gpu(img, tag)
-                if texture:
-                    self._cache[tag] = texture
-                    return texture
-                return self._emergency_texture
+            texture = self._add_to_atlas(self._decode_flag(flag_path), tag)
+            if texture:
+                self._cache_put(tag, texture)
+                return texture
+            return self._emergency_texture
         except Exception as e:
             print(f"[FlagRenderer] Load Error {tag}: {e}")
             return self._emergency_texture
 
+    def prewarm(self, tags: Iterable[str]):
+        """
+        Loads many flags up front so the UI never stalls on a cache miss.
+        PNG decoding runs in a thread pool (Pillow releases the GIL while decoding);
+        the GPU writes stay on the calling thread, which must own the GL context.
+        """
+        pending: List[Tuple[str, Path]] = []
+        for tag in tags:
+            if tag in self._cache:
+                continue
+            flag_path = self._resolve_flag_path(tag.strip())
+            if flag_path is not None:
+                pending.append((tag, flag_path))
+
+        if not pending:
+            return
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            decoded = list(pool.map(self._try_decode_flag, [p for _, p in pending]))
+
+        for (tag, _), pixels in zip(pending, decoded):
+            if pixels is None:
+                continue
+            # Same guard as get_texture: one bad flag must not abort the view
+            try:
+                texture = self._add_to_atlas(pixels, tag)
+            except Exception as e:
+                print(f"[FlagRenderer] Load Error {tag}: {e}")
+                continue
+            if texture:
+                self._cache_put(tag, texture)
+
+        print(f"[FlagRenderer] Prewarmed {len(pending)} flags.")
+
+    def _resolve_flag_path(self, clean_tag: str) -> Optional[Path]:
+        """Exact match, then lowercase. None if the tag has no flag of its own."""
+        flag_path = self.flags_dir / f"{clean_tag}.png"
+        if flag_path.exists():
+            return flag_path
+        lower_path = self.flags_dir / f"{clean_tag.lower()}.png"
+        if lower_path.exists():
+            return lower_path
+        return None
+
+    @staticmethod
+    def _decode_flag(flag_path: Path) -> np.ndarray:
+        """Decodes a flag PNG into an (H, W, 4) uint8 array that fits an atlas cell. Thread-safe."""
+        # One read syscall for the whole file, then decode from memory
+        img = Image.open(io.BytesIO(flag_path.read_bytes()))
+        # Palette/bilevel images are expanded first (PIL would otherwise
+        # resize them with NEAREST). Everything else is shrunk in its decoded
+        # mode and converted afterwards, so the RGBA pass runs on the cell-sized
+        # image instead of the full-resolution source.
+        if img.mode in ("P", "1"):
+            img = img.convert("RGBA")
+        if img.width > FLAG_CELL_SIZE[0] or img.height > FLAG_CELL_SIZE[1]:
+            img.thumbnail(FLAG_CELL_SIZE)
+        if img.mode != "RGBA":
+            img = img.convert("RGBA")
+        # np.array, not np.asarray: the upload needs a writable buffer, and
+        # asarray would return a read-only view of PIL's memory
+        return np.array(img)
+
+    @classmethod
+    def _try_decode_flag(cls, flag_path: Path) -> Optional[np.ndarray]:
+        try:
+            return cls._decode_flag(flag_path)
+        except Exception as e:
+            print(f"[FlagRenderer] Load Error {flag_path.name}: {e}")
+            return None
+
     def clear_cache(self):
-        self._cache.clear()
\ No newline at end of file
+        self._cache.clear()
+        self._refcount.clear()
+        if self._atlas is not None:
+            self._atlas.reset()
\ No newline at end of file
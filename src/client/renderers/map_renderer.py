@@ -1,7 +1,9 @@
 import arcade
 import arcade.gl
+import hashlib
 import numpy as np
-from typing import Optional, List, Dict, Tuple, Set
+from collections import OrderedDict
+from typing import Optional, Dict, Tuple
 from pathlib import Path
 
 from src.core.map_data import RegionMapData
@@ -9,10 +11,20 @@ from src.core.map_indexer import MapIndexer
 from src.client.shader_registry import ShaderRegistry
 from src.client.renderers.sphere_mesh import SphereMesh
 from src.client.renderers.base_renderer import BaseRenderer
-from src.client.renderers.camera_controller import CameraController
+from src.client.renderers.camera_controller import GlobeCameraController
 from src.client.renderers.texture_manager import TextureManager
 from src.client.renderers.picking_utils import PickingUtils
 
+# u_overlay_mode values understood by globe.frag
+MODE_TERRAIN = 0
+MODE_OVERLAY = 1
+
+# Empty multi-selection (sorted unique dense ids)
+_NO_SELECTION = np.empty(0, dtype=np.int64)
+
+# Resolved highlights kept for repeated selections (LRU)
+MAX_CACHED_HIGHLIGHTS = 64
+
 
 class MapRenderer(BaseRenderer):
     """
@@ -28,6 +40,7 @@ class MapRenderer(BaseRenderer):
         map_data: RegionMapData,
         map_img_path: Path,
         terrain_img_path: Path,
+        terrain_pixels: Optional[np.ndarray] = None,
     ):
         super().__init__()
         
@@ -36,7 +49,7 @@ class MapRenderer(BaseRenderer):
         self.height = map_data.height
 
         # --- COMPONENTS ---
-        self.camera = CameraController()
+        self.camera = GlobeCameraController()
         self.texture_manager = TextureManager(self.ctx)
         
         # --- CACHING COMPONENT ---
@@ -44,15 +57,35 @@ class MapRenderer(BaseRenderer):
 
         # --- SELECTION STATE ---
         self.single_select_dense_id: int = -1
+        self.selected_group: int = 0
+        # Multi-select requested by callers vs. what the selection mask holds.
+        # Requests only record the target (sorted unique dense ids);
+        # draw() uploads at most once per frame.
+        self._desired_multi_select: np.ndarray = _NO_SELECTION
+        self._selection_dirty: bool = False
+        # real id buffer -> sorted unique valid dense ids (see set_highlight)
+        self._highlight_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
 
         # --- GLOBE STATE ---
         self.globe_radius: float = 1.0
 
+        # --- RENDER MODES ---
+        # mode name -> (u_overlay_mode, u_opacity); unknown modes draw as terrain
+        self._mode_configs: Dict[str, Tuple[int, float]] = {
+            "overlay": (MODE_OVERLAY, 0.90),
+            "political": (MODE_OVERLAY, 0.90),
+            "terrain": (MODE_TERRAIN, 1.00),
+        }
+        self._current_mode: Optional[str] = None
+
         # --- GL RESOURCES ---
         self.program: Optional[arcade.gl.Program] = None
         self.sphere: Optional[SphereMesh] = None
 
-        self._init_resources(terrain_img_path, map_img_path)
+        # Last value written per uniform; draw() skips writes that would not change anything
+        self._last_uniforms: Dict[str, object] = {}
+
+        self._init_resources(terrain_img_path, map_img_path, terrain_pixels)
         self._init_glsl_globe()
 
     # -------------------------------------------------------------------------
@@ -60,7 +93,7 @@ class MapRenderer(BaseRenderer):
     # -------------------------------------------------------------------------
 
 
-    def _init_resources(self, terrain_path: Path, map_path: Path):
+    def _init_resources(self, terrain_path: Path, map_path: Path, terrain_pixels: Optional[np.ndarray] = None):
         """Initialize all textures and resources."""
         # Load map texture
         self.texture_manager.load_map_texture(
@@ -71,8 +104,8 @@ class MapRenderer(BaseRenderer):
             self.indexer
         )
         
-        # Load terrain texture
-        self.texture_manager.load_terrain_texture(terrain_path)
+        # Load terrain texture (decoded here unless a loading task already did it)
+        self.texture_manager.load_terrain_texture(terrain_path, terrain_pixels)
         
         # Initialize lookup texture
         self.texture_manager.init_lookup_texture()
@@ -84,10 +117,33 @@ class MapRenderer(BaseRenderer):
     def _set_uniform_if_present(self, name: str, value):
         """Safely set uniform if it exists in the shader."""
         super()._set_uniform_if_present(self.program, name, value)
+        self._last_uniforms[name] = value
+
+    def _set_uniform_cached(self, name: str, value):
+        """Set uniform only if the value differs from the last one written."""
+        if self._last_uniforms.get(name) != value:
+            self._set_uniform_if_present(name, value)
+
+    def set_mode(self, mode: str):
+        """
+        Select the render mode by name. The name is resolved to its uniform set
+        once here; draw() without a mode keeps drawing with the current one.
+        """
+        self._apply_mode(mode)
+
+    def _apply_mode(self, mode: str):
+        """Writes the uniform set of 'mode', only when the mode changes."""
+        if mode == self._current_mode:
+            return
+        overlay_mode, opacity = self._mode_configs.get(mode, self._mode_configs["terrain"])
+        self._set_uniform_cached("u_overlay_mode", overlay_mode)
+        self._set_uniform_cached("u_opacity", opacity)
+        self._current_mode = mode
 
     def _init_glsl_globe(self):
         """Initialize the globe shader and geometry."""
         shader_source = ShaderRegistry.load_bundle(ShaderRegistry.GLOBE_V, ShaderRegistry.GLOBE_F)
+        self._last_uniforms = {}
         self.program = self.ctx.program(
             vertex_shader=shader_source["vertex_shader"],
             fragment_shader=shader_source["fragment_shader"],
@@ -97,14 +153,18 @@ class MapRenderer(BaseRenderer):
         self._set_uniform_if_present("u_map_texture", 0)
         self._set_uniform_if_present("u_lookup_texture", 1)
         self._set_uniform_if_present("u_terrain_texture", 2)
+        self._set_uniform_if_present("u_group_texture", 3)
+        self._set_uniform_if_present("u_selection_texture", 4)
+        self._set_uniform_if_present("u_palette_texture", 5)
 
         # Set LUT uniforms
         self.texture_manager.set_uniforms(self.program)
         
         # Set other uniforms
         self._set_uniform_if_present("u_selected_id", -1)
-        self._set_uniform_if_present("u_overlay_mode", 1)
-        self._set_uniform_if_present("u_opacity", 0.90)
+        self._set_uniform_if_present("u_selected_group", 0)
+        self._current_mode = None
+        self._apply_mode("overlay")
         self._set_uniform_if_present("u_light_dir", (0.4, 0.3, 1.0))
         self._set_uniform_if_present("u_ambient", 0.35)
 
@@ -123,39 +183,90 @@ class MapRenderer(BaseRenderer):
     # -------------------------------------------------------------------------
 
     def update_overlay(self, color_map: Dict[int, Tuple[int, int, int]]):
-        """Update overlay colors using texture manager."""
+        """Update overlay colors from a legacy {real_id: (r, g, b)} dict."""
         self.texture_manager.update_overlay(color_map)
 
+    def update_overlay_arrays(self, ids: np.ndarray, rgb: np.ndarray):
+        """Update overlay colors from parallel (ids, rgb) arrays produced by a MapMode."""
+        self.texture_manager.update_overlay_arrays(ids, rgb)
+
+    def update_region_groups(self, ids: np.ndarray, groups: np.ndarray):
+        """Assign a group id (1..65535, e.g. per owner) to each real region id."""
+        self.texture_manager.update_region_groups(ids, groups)
+
     # -------------------------------------------------------------------------
     # Selection API
     # -------------------------------------------------------------------------
 
-    def set_highlight(self, real_region_ids: List[int]):
-        """Set highlighted regions using texture manager."""
-        if not real_region_ids:
+    def set_highlight_group(self, group: int):
+        """
+        Highlight every region of a group (see update_region_groups).
+        Only a uniform changes; the LUT is not touched unless a multi-select
+        has to be cleared.
+        """
+        self.single_select_dense_id = -1
+        self.selected_group = int(group)
+        self._request_multi_select(_NO_SELECTION)
+
+    def set_highlight(self, real_region_ids):
+        """Set highlighted regions (list or int array of real ids) using texture manager."""
+        real_ids = np.asarray(real_region_ids, dtype=np.int64).ravel()
+        if real_ids.size == 0:
             self.clear_highlight()
             return
 
-        valid_dense_ids: List[int] = []
-        for rid in real_region_ids:
-            if rid in self.texture_manager.real_to_dense:
-                valid_dense_ids.append(self.texture_manager.real_to_dense[rid])
+        self.selected_group = 0
+        valid_dense_ids = self._resolve_highlight(real_ids)
 
-        if not valid_dense_ids:
+        if valid_dense_ids.size == 0:
             return
 
-        if len(valid_dense_ids) == 1:
-            self.single_select_dense_id = valid_dense_ids[0]
-            self.texture_manager.update_selection(set())
+        if valid_dense_ids.size == 1:
+            self.single_select_dense_id = int(valid_dense_ids[0])
+            self._request_multi_select(_NO_SELECTION)
         else:
             self.single_select_dense_id = -1
-            new_set = set(valid_dense_ids)
-            self.texture_manager.update_selection(new_set)
+            self._request_multi_select(valid_dense_ids)
+
+    def _resolve_highlight(self, real_ids: np.ndarray) -> np.ndarray:
+        """
+        Real ids -> sorted unique valid dense ids, LRU-cached by a content digest
+        of the id buffer, so re-selecting the same regions (or country) skips the
+        translation. The 16-byte digest keeps large countries from pinning
+        their whole id list as a dict key.
+        """
+        key = hashlib.blake2b(memoryview(real_ids).cast("B"), digest_size=16).digest()
+        cached = self._highlight_cache.get(key)
+        if cached is not None:
+            self._highlight_cache.move_to_end(key)
+            return cached
+
+        dense_ids = self.texture_manager.to_dense_ids(real_ids)
+        resolved = np.unique(dense_ids[dense_ids >= 0])
+
+        self._highlight_cache[key] = resolved
+        if len(self._highlight_cache) > MAX_CACHED_HIGHLIGHTS:
+            self._highlight_cache.popitem(last=False)
+        return resolved
 
     def clear_highlight(self):
         """Clear all highlights."""
         self.single_select_dense_id = -1
-        self.texture_manager.update_selection(set())
+        self.selected_group = 0
+        self._request_multi_select(_NO_SELECTION)
+
+    def _request_multi_select(self, dense_ids: np.ndarray):
+        """Record the wanted multi-select; applied (once) by the next draw()."""
+        self._desired_multi_select = dense_ids
+        self._selection_dirty = True
+
+    def _apply_pending_selection(self):
+        if not self._selection_dirty:
+            return
+        self._selection_dirty = False
+        # Exact array compare (vectorized), no Python set built per request
+        if not np.array_equal(self._desired_multi_select, self.texture_manager.multi_select_dense_ids):
+            self.texture_manager.update_selection(self._desired_multi_select)
 
     # -------------------------------------------------------------------------
     # Input handlers (call these from your View)
@@ -181,8 +292,8 @@ class MapRenderer(BaseRenderer):
     # Rendering
     # -------------------------------------------------------------------------
 
-    def draw(self, mode: str = "overlay"):
-        """Render the globe."""
+    def draw(self, mode: Optional[str] = None):
+        """Render the globe. 'mode' is a shorthand for set_mode(mode) first."""
         if self.program is None or self.sphere is None or self.sphere.geo is None:
             return
         
@@ -193,37 +304,40 @@ class MapRenderer(BaseRenderer):
         # Enable rendering state
         self._enable_rendering_state()
         
-        # Bind textures
-        self.texture_manager.bind_textures(self.program)
+        # Apply the latest selection request (many requests per frame -> one upload)
+        self._apply_pending_selection()
+
+        # Bind textures (sampler units are fixed at shader init)
+        self.texture_manager.bind_textures()
         
         # Set matrix uniforms
+        # The matrices are plain 16-float tuples, so an idle camera (or a fixed
+        # window size for the projection) compares equal and skips the upload.
         model, view, proj = self.camera.get_matrices()
-        self.program["u_model"] = model
-        self.program["u_view"] = view
-        self.program["u_projection"] = proj
+        self._set_uniform_cached("u_model", model)
+        self._set_uniform_cached("u_view", view)
+        self._set_uniform_cached("u_projection", proj)
         
-        # Set selection uniform
-        self.program["u_selected_id"] = int(self.single_select_dense_id)
+        # Set selection uniforms
+        self._set_uniform_cached("u_selected_id", int(self.single_select_dense_id))
+        self._set_uniform_cached("u_selected_group", self.selected_group)
         
         # Set camera position for atmospheric effects
-        camera_pos = self.camera.get_position()
-        self._set_uniform_if_present("u_camera_pos", camera_pos)
-
-        # Keep lighting stable relative to the view (headlight).
-        # u_light_dir is expected in world space; using the camera direction avoids
-        # the globe going dark when the user orbits the camera.
-        lx, ly, lz = camera_pos
-        mag = (lx * lx + ly * ly + lz * lz) ** 0.5
-        if mag > 1e-8:
-            self._set_uniform_if_present("u_light_dir", (lx / mag, ly / mag, lz / mag))
+        camera_pos = tuple(self.camera.get_position())
+        if self._last_uniforms.get("u_camera_pos") != camera_pos:
+            self._set_uniform_if_present("u_camera_pos", camera_pos)
+
+            # Keep lighting stable relative to the view (headlight).
+            # u_light_dir is expected in world space; using the camera direction avoids
+            # the globe going dark when the user orbits the camera.
+            lx, ly, lz = camera_pos
+            mag = (lx * lx + ly * ly + lz * lz) ** 0.5
+            if mag > 1e-8:
+                self._set_uniform_if_present("u_light_dir", (lx / mag, ly / mag, lz / mag))
         
-        # Set rendering mode
-        if mode in ("overlay", "political"):
-            self._set_uniform_if_present("u_overlay_mode", 1)
-            self._set_uniform_if_present("u_opacity", 0.90)
-        else:
-            self._set_uniform_if_present("u_overlay_mode", 0)
-            self._set_uniform_if_present("u_opacity", 1.00)
+        # Set rendering mode (no-op while the mode is unchanged)
+        if mode is not None:
+            self._apply_mode(mode)
         
         # Render sphere
         self.sphere.geo.render(self.program)
@@ -248,10 +362,15 @@ class MapRenderer(BaseRenderer):
         vp_matrix, model_matrix = self.camera.get_cached_matrices()
         if vp_matrix is None or model_matrix is None:
             return 0
+        # Inverted once per camera change, shared by both attempts below and by
+        # every later pick (e.g. hovering) until the camera moves
+        inv_vp, inv_model = self.camera.get_inverse_matrices()
+        if inv_vp is None:
+            return 0
 
         # Try both coordinate systems - Arcade bottom-left and potential UI top-left
         for test_sy in [sy, h - sy]:
-            ray_o, ray_d = PickingUtils.screen_to_ray(sx, test_sy, w, h, vp_matrix)
+            ray_o, ray_d = PickingUtils.screen_to_ray(sx, test_sy, w, h, vp_matrix, inv_vp)
             if ray_o is None or ray_d is None:
                 continue
 
@@ -263,16 +382,17 @@ class MapRenderer(BaseRenderer):
             hit = ray_o + ray_d * t
 
             # Convert hit to UV coordinates
-            uv_result = PickingUtils.world_to_uv_coords(hit, model_matrix)
+            uv_result = PickingUtils.world_to_uv_coords(hit, model_matrix, inv_model)
             if uv_result is None:
                 continue
             
             u, v = uv_result
 
-            # Convert UV to pixel coordinates
+            # Convert UV to pixel coordinates (always inside the map: x wraps, y clamps)
             px, py = PickingUtils.uv_to_pixel_coords(u, v, self.width, self.height)
 
-            region_id = self.map_data.get_region_id(px, py)
+            # Direct buffer read; the bounds check in get_region_id would be redundant
+            region_id = self.map_data.packed_map.item(py, px)
             if region_id > 0:
                 return region_id
         
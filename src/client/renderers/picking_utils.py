@@ -39,9 +39,10 @@ class PickingUtils:
         screen_y: float, 
         window_width: int, 
         window_height: int,
-        view_proj_matrix: np.ndarray
+        view_proj_matrix: np.ndarray,
+        inv_view_proj: Optional[np.ndarray] = None
     ) -> tuple[Optional[np.ndarray], Optional[np.ndarray]]:
-        """Convert screen coordinates to world ray."""
+        """Convert screen coordinates to world ray. Pass 'inv_view_proj' to reuse a cached inverse."""
         if window_width <= 0 or window_height <= 0:
             return None, None
         
@@ -50,10 +51,13 @@ class PickingUtils:
         x = (2.0 * float(screen_x) / float(window_width)) - 1.0
         y = (2.0 * float(screen_y) / float(window_height)) - 1.0
         
-        try:
-            inv_vp = np.linalg.inv(view_proj_matrix)
-        except np.linalg.LinAlgError:
-            return None, None
+        if inv_view_proj is not None:
+            inv_vp = inv_view_proj
+        else:
+            try:
+                inv_vp = np.linalg.inv(view_proj_matrix)
+            except np.linalg.LinAlgError:
+                return None, None
         
         # Near and far points in NDC
         p_near = np.array([x, y, -1.0, 1.0], dtype=np.float32)
@@ -81,12 +85,17 @@ class PickingUtils:
         return ray_o, ray_d
     
     @staticmethod
-    def world_to_uv_coords(hit_point: np.ndarray, model_matrix: np.ndarray) -> Optional[tuple[float, float]]:
-        """Convert world hit point to UV coordinates on sphere."""
-        try:
-            inv_model = np.linalg.inv(model_matrix)
-        except np.linalg.LinAlgError:
-            return None
+    def world_to_uv_coords(
+        hit_point: np.ndarray,
+        model_matrix: np.ndarray,
+        inv_model: Optional[np.ndarray] = None
+    ) -> Optional[tuple[float, float]]:
+        """Convert world hit point to UV coordinates on sphere. Pass 'inv_model' to reuse a cached inverse."""
+        if inv_model is None:
+            try:
+                inv_model = np.linalg.inv(model_matrix)
+            except np.linalg.LinAlgError:
+                return None
         
         # Transform to local sphere coordinates
         local = inv_model @ np.array([hit_point[0], hit_point[1], hit_point[2], 1.0], dtype=np.float32)
@@ -115,8 +124,15 @@ class PickingUtils:
         texture_width: int, 
         texture_height: int
     ) -> tuple[int, int]:
-        """Convert UV coordinates to pixel coordinates."""
+        """
+        Convert UV coordinates to pixel coordinates, always inside the texture
+        (x wraps around the globe, y is clamped at the poles).
+        """
         px = int(u * texture_width) % texture_width
-        py = int((1.0 - v) * texture_height)
-        py = max(0, min(py, texture_height - 1))
+        # Y-only flip in integer math: row = (H - 1) - floor(v * H)
+        py = texture_height - 1 - int(v * texture_height)
+        if py < 0:
+            py = 0
+        elif py >= texture_height:
+            py = texture_height - 1
         return px, py
@@ -2,10 +2,14 @@
 
 uniform sampler2D u_terrain_texture;
 uniform sampler2D u_map_texture;
-uniform sampler2D u_lookup_texture;
+uniform usampler2D u_lookup_texture;
+uniform sampler2D u_group_texture;
+uniform sampler2D u_selection_texture;
+uniform sampler2D u_palette_texture;
 
 uniform float u_lut_dim;
 uniform int   u_selected_id;
+uniform int   u_selected_group;
 uniform int   u_overlay_mode;
 uniform float u_opacity;
 
@@ -19,31 +23,62 @@ in vec3 v_world_pos;
 
 out vec4 out_color;
 
+// Map texels are the little-endian bytes of the dense id: R = low byte
 int decode_id(vec3 rgb) {
     ivec3 c = ivec3(rgb * 255.0 + 0.5);
-    return (c.r << 16) | (c.g << 8) | c.b;
+    return (c.b << 16) | (c.g << 8) | c.r;
 }
 
-vec4 lut_lookup(int dense_id) {
-    int x = dense_id % int(u_lut_dim);
-    int y = dense_id / int(u_lut_dim);
-    vec2 uv = (vec2(x, y) + vec2(0.5)) / vec2(u_lut_dim, u_lut_dim);
-    return texture(u_lookup_texture, uv);
+// u_lut_dim is the LUT width. Ids inside the first row (every id when the LUT
+// is a single row, the usual case) skip the integer divide entirely.
+// Computed once per fragment and shared by all LUT-shaped textures.
+ivec2 lut_texel(int dense_id) {
+    int w = int(u_lut_dim);
+    if (dense_id < w) return ivec2(dense_id, 0);
+    return ivec2(dense_id % w, dense_id / w);
+}
+
+// LUT texels hold a palette index + 1 (0 = no color); the palette is 256 texels wide
+vec4 lut_lookup(ivec2 texel) {
+    int idx = int(texelFetch(u_lookup_texture, texel, 0).r);
+    if (idx == 0) return vec4(0.0);
+    int p = idx - 1;
+    return texelFetch(u_palette_texture, ivec2(p & 255, p >> 8), 0);
+}
+
+// 16-bit group id stored as R (low byte) + G (high byte)
+int group_lookup(ivec2 texel) {
+    ivec2 g = ivec2(texelFetch(u_group_texture, texel, 0).rg * 255.0 + 0.5);
+    return g.r | (g.g << 8);
+}
+
+// Multi-selection mask: 1.0 = selected, 0.0 = not
+float selection_lookup(ivec2 texel) {
+    return texelFetch(u_selection_texture, texel, 0).r;
 }
 
 void main() {
     vec2 uv = vec2(fract(v_uv.x), clamp(v_uv.y, 0.0, 1.0));
+    // Map and terrain textures are uploaded top row first (image order),
+    // so v is flipped here instead of flipping the images on the CPU
+    vec2 image_uv = vec2(uv.x, 1.0 - uv.y);
 
     vec3 n = normalize(v_nrm_ws);
     float ndotl = max(dot(n, normalize(u_light_dir)), 0.0);
     float light = u_ambient + (1.0 - u_ambient) * ndotl;
 
-    vec4 terrain = texture(u_terrain_texture, uv);
+    vec4 terrain = texture(u_terrain_texture, image_uv);
     vec3 base = terrain.rgb * light;
 
     // dense id -> overlay
-    int dense_id = decode_id(texture(u_map_texture, uv).rgb);
-    vec4 overlay = lut_lookup(dense_id);
+    int dense_id = decode_id(texture(u_map_texture, image_uv).rgb);
+    ivec2 texel = lut_texel(dense_id);
+    vec4 overlay = lut_lookup(texel);
+
+    // Multi-selection only applies to colored regions; selected ones draw
+    // their overlay at full alpha (LUT alpha is the normal 200/255)
+    float multi_sel = (overlay.a > 0.0 && selection_lookup(texel) > 0.5) ? 1.0 : 0.0;
+    overlay.a = max(overlay.a, multi_sel);
 
     // Ensure uniforms are "used" (prevents optimization removing them)
     float opacity = u_opacity;
@@ -79,14 +114,14 @@ vec3 fog_color = vec3(0.7, 0.8, 0.9); // Light blue fog
 final_color.rgb = mix(final_color.rgb, fog_color, depth_fog);
 
 // --- Selection highlight ---
-// Single selection (uses uniform) OR multi-selection (uses LUT alpha = 255)
+// Single selection (uses uniform) OR multi-selection (uses the selection mask)
 float single_sel = (u_selected_id >= 0 && dense_id == u_selected_id) ? 1.0 : 0.0;
 
-// LUT alpha is normalized 0..1. Selected regions are written as 255 => ~1.0.
-// Use a slightly lower threshold to be robust (255, 254, etc.)
-float multi_sel  = (overlay.a > 0.95) ? 1.0 : 0.0;
+// Group selection (e.g. a whole country): one uniform, no LUT rewrite.
+// && short-circuits, so the group texture is only fetched while a group is selected.
+float group_sel = (u_selected_group > 0 && group_lookup(texel) == u_selected_group) ? 1.0 : 0.0;
 
-float sel = max(single_sel, multi_sel);
+float sel = max(max(single_sel, multi_sel), group_sel);
 
 if (sel > 0.0) {
     vec3 highlight_color = vec3(1.0);
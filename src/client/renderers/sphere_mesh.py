@@ -56,8 +56,8 @@ class SphereMesh:
         idx = np.array(indices, dtype=np.uint32)
 
         # IMPORTANT: Arcade ctx.buffer is keyword-only (data=...)
-        self.vbo = ctx.buffer(data=vtx.tobytes())
-        self.ibo = ctx.buffer(data=idx.tobytes())
+        self.vbo = ctx.buffer(data=memoryview(vtx).cast("B"))
+        self.ibo = ctx.buffer(data=memoryview(idx).cast("B"))
         self.index_count = int(idx.size)
 
         self.geo: arcade.gl.Geometry | None = None
@@ -1,36 +1,126 @@
 import arcade
+import hashlib
+import itertools
 import numpy as np
 from pathlib import Path
-from typing import Dict, Tuple, Optional, List, Set
+from typing import Dict, Tuple, Optional
 from PIL import Image
 
 
+# Palette texels are packed little-endian RGBA8: R | G<<8 | B<<16 | A<<24
+PALETTE_ALPHA_NORMAL = np.uint32(200 << 24)
+
+# Palette entry 'p' lives at texel (p % PALETTE_WIDTH, p // PALETTE_WIDTH).
+# LUT texels hold 'p + 1' as uint16 (0 = no color), so at most 65535 entries.
+PALETTE_WIDTH = 256
+MAX_PALETTE_SIZE = 0xFFFF
+
+
+def build_palette(rgb: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Splits (N, 3) uint8 colors into (N,) palette indexes and a (P,) packed
+    RGBA palette (alpha 200). Pure array in / array out.
+    """
+    rgb32 = rgb.astype(np.uint32)
+    packed = rgb32[:, 0] | (rgb32[:, 1] << 8) | (rgb32[:, 2] << 16)
+    keys, index = np.unique(packed, return_inverse=True)
+
+    # Too many distinct colors for 16-bit indexes (only a continuous gradient
+    # over a huge map gets there): drop the low 3 bits per channel (<= 32768 colors)
+    if keys.size > MAX_PALETTE_SIZE:
+        keys, index = np.unique(packed & np.uint32(0xF8F8F8), return_inverse=True)
+
+    return index.reshape(-1), keys | PALETTE_ALPHA_NORMAL
+
+
+def fill_lut(out: np.ndarray, dense_ids: np.ndarray, palette_index: np.ndarray) -> None:
+    """
+    LUT kernel: writes palette index + 1 into 'out' (N,) uint16; 0 = no color.
+    'dense_ids' must already be valid rows (1..N-1), parallel to 'palette_index' (M,).
+    Selection is not baked in: it lives in the separate selection mask.
+    Pure array in / array out, no Python-level per-region work, so it can run
+    on a worker thread or be swapped for a compiled kernel without touching callers.
+    """
+    # One 16-bit store per region
+    out.fill(0)
+    out[dense_ids] = palette_index + 1
+
+
+# Largest real id range served by the flat real -> dense table (16 MiB of int32).
+MAX_FLAT_ID_LOOKUP = 1 << 22
+
+# Above this many texel runs a selection change is uploaded as one row span;
+# past that point per-call driver overhead outweighs the bytes saved.
+MAX_LUT_SUB_UPLOADS = 64
+
+
 class TextureManager:
     """Manages loading, caching, and updating of textures for rendering."""
     
-    def __init__(self, ctx: arcade.gl.Context, lut_dim: int = 4096):
+    def __init__(self, ctx: arcade.gl.Context):
         self.ctx = ctx
-        self.lut_dim = lut_dim
+        # GPU shape of the LUT (set by init_lookup_texture from the region count).
+        # Dense id 'i' lives at texel (i % lut_width, i // lut_width).
+        self.lut_width = 1
+        self.lut_rows = 1
         
         # Texture storage
         self.map_texture: Optional[arcade.gl.Texture] = None
         self.terrain_texture: Optional[arcade.gl.Texture] = None
         self.lookup_texture: Optional[arcade.gl.Texture] = None
+        self.group_texture: Optional[arcade.gl.Texture] = None
+        self.selection_texture: Optional[arcade.gl.Texture] = None
+        self.palette_texture: Optional[arcade.gl.Texture] = None
         
-        # LUT data for overlays
-        self.lut_data = np.full((self.lut_dim * self.lut_dim, 4), 0, dtype=np.uint8)
+        # LUT data for overlays: one uint16 palette index + 1 per dense region id
+        # (0 = no color). Allocated by init_lookup_texture once the region count is known.
+        # The colors themselves live in the small palette, so an overlay change
+        # uploads 2 bytes per region plus a few hundred palette texels.
+        self.lut_index = np.zeros(0, dtype=np.uint16)
+
+        # Overlay palette: packed RGBA8 per entry, PALETTE_WIDTH entries per row
+        self.palette_u32 = np.zeros(0, dtype=np.uint32)
+        self.palette_size = 0
+
+        # Per-region group id (e.g. owner), same layout as the LUT.
+        # 16-bit id split over R (low byte) and G (high byte); 0 = no group.
+        # Lets the shader highlight a whole group from a single uniform.
+        self.group_data = np.zeros((0, 2), dtype=np.uint8)
+
+        # Multi-selection mask, same layout as the LUT: 255 = selected, 0 = not.
+        # Kept apart from the colors so toggling a selection never touches the LUT.
+        self.selection_mask = np.zeros(0, dtype=np.uint8)
         
-        # Color mapping state
-        self._active_color_map: Dict[int, Tuple[int, int, int]] = {}
+        # Color mapping state (Struct of Arrays: real ids + palette index per id)
+        self._active_ids: np.ndarray = np.empty(0, dtype=np.int64)
+        self._active_index: np.ndarray = np.empty(0, dtype=np.int64)
+        # (real ids, valid mask, LUT rows) of the last translation; overlays
+        # over the same regions reuse it instead of re-translating every id
+        self._lut_rows_cache: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        # Content digest of the last (ids, rgb) overlay; equal input skips the rebuild
+        self._overlay_digest: Optional[bytes] = None
         self._default_color = (40, 40, 40)
         
-        # Selection state
-        self.multi_select_dense_ids: Set[int] = set()
-        self.prev_multi_select_dense_ids: Set[int] = set()
+        # Selection state (sorted unique dense ids)
+        self.multi_select_dense_ids: np.ndarray = np.empty(0, dtype=np.int64)
+        self.prev_multi_select_dense_ids: np.ndarray = np.empty(0, dtype=np.int64)
         
         # Region ID mappings
-        self.real_to_dense: Dict[int, int] = {}
-        self.dense_to_real: List[int] = []
+        # 'dense_to_real' is the sorted unique id array from the indexer;
+        # '_real_to_dense_arr' is a flat real -> dense table (-1 = unknown),
+        # only built when the id range keeps it under MAX_FLAT_ID_LOOKUP entries.
+        self.dense_to_real: np.ndarray = np.empty(0, dtype=np.int64)
+        self._real_to_dense_arr: Optional[np.ndarray] = None
+        self._real_to_dense_dict: Optional[Dict[int, int]] = None
+
+    @property
+    def real_to_dense(self) -> Dict[int, int]:
+        """Dict view of the id mapping for ad-hoc lookups, built on first access."""
+        if self._real_to_dense_dict is None:
+            self._real_to_dense_dict = {
+                real_id: i for i, real_id in enumerate(self.dense_to_real.tolist())
+            }
+        return self._real_to_dense_dict
     
     def load_map_texture(
         self, 
@@ -47,115 +137,388 @@ class TextureManager:
             map_data_array=packed_map,
         )
         
-        self.dense_to_real = unique_ids
-        self.real_to_dense = {real_id: i for i, real_id in enumerate(unique_ids)}
+        self.dense_to_real = np.asarray(unique_ids)
+        self._real_to_dense_dict = None
+        self._lut_rows_cache = None
+        self._build_real_to_dense_table()
         print(f"[TextureManager] Indexed {len(unique_ids)} unique regions.")
         
-        # Encode dense map into RGB texture
-        dense_map = dense_map.reshape((height, width)).astype(np.uint32)
-        r = ((dense_map >> 16) & 0xFF).astype(np.uint8)
-        g = ((dense_map >> 8) & 0xFF).astype(np.uint8)
-        b = (dense_map & 0xFF).astype(np.uint8)
-        
-        encoded_data = np.dstack((r, g, b))
-        encoded_data = np.flipud(encoded_data)
+        # Encode dense map into RGBA texture
+        # A little-endian uint32 already holds the id as bytes (low, mid, high, 0),
+        # so each RGBA texel is exactly one uint32: R = low, G = mid, B = high byte.
+        # 4-byte texels keep rows aligned, so the driver uploads without repacking.
+        # Rows are uploaded top-first as in the image; the shader flips v instead
+        # of the CPU flipping the whole map (see image_uv in globe.frag).
+        encoded_data = np.ascontiguousarray(dense_map.reshape((height, width)), dtype="<u4")
         
         self.map_texture = self.ctx.texture(
             (width, height),
-            components=3,
-            data=encoded_data.tobytes(),
+            components=4,
+            data=memoryview(encoded_data).cast("B"),
             filter=(self.ctx.NEAREST, self.ctx.NEAREST),
         )
         self.map_texture.wrap_x = self.ctx.REPEAT
         self.map_texture.wrap_y = self.ctx.CLAMP_TO_EDGE
     
-    def load_terrain_texture(self, terrain_path: Path) -> None:
-        """Load the terrain texture from file."""
+    @classmethod
+    def decode_terrain(cls, terrain_path: Path) -> np.ndarray:
+        """
+        Decodes the terrain image into (H, W, 3|4) uint8 pixels.
+        Touches no GL state, so loading tasks can run it on a worker thread
+        and hand the result to load_terrain_texture.
+        """
         if not terrain_path.exists():
             raise FileNotFoundError(f"[TextureManager] Terrain path not found: {terrain_path}")
-        
-        tw, th, rgba = self._load_image_rgba_flipped(terrain_path)
+        return cls._load_image_pixels(terrain_path)[2]
+
+    def load_terrain_texture(self, terrain_path: Path, pixels: Optional[np.ndarray] = None) -> None:
+        """Load the terrain texture from file, or from pixels already decoded by decode_terrain."""
+        if pixels is None:
+            pixels = self.decode_terrain(terrain_path)
+        th, tw = pixels.shape[:2]
         self.terrain_texture = self.ctx.texture(
             (tw, th),
-            components=4,
-            data=rgba,
+            components=pixels.shape[2],
+            data=memoryview(pixels),
             filter=(self.ctx.LINEAR, self.ctx.LINEAR),
         )
         self.terrain_texture.wrap_x = self.ctx.REPEAT
         self.terrain_texture.wrap_y = self.ctx.CLAMP_TO_EDGE
     
     def init_lookup_texture(self) -> None:
-        """Initialize the lookup texture for color overlays."""
+        """
+        Initialize the lookup texture for color overlays.
+        Sized to the indexed region count: a single row (effectively 1D) when it
+        fits the GL size limit, otherwise as few full-width rows as needed.
+        Call after load_map_texture.
+        """
+        count = max(1, len(self.dense_to_real))
+        self.lut_width = min(count, self.ctx.info.MAX_TEXTURE_SIZE)
+        self.lut_rows = -(-count // self.lut_width)
+        texels = self.lut_width * self.lut_rows
+
+        # CPU mirrors are exactly as large as the textures (a few hundred KiB
+        # for a typical map instead of a fixed 4096^2 buffer)
+        self.lut_index = np.zeros(texels, dtype=np.uint16)
+        self._overlay_digest = None
+        self._lut_rows_cache = None
+        self.group_data = np.zeros((texels, 2), dtype=np.uint8)
+        self.selection_mask = np.zeros(texels, dtype=np.uint8)
+
+        # Textures are created directly from the zeroed mirrors (GL leaves
+        # storage without data undefined), one call each and no bytes copies.
+        # R16UI: read with texelFetch through a usampler2D
         self.lookup_texture = self.ctx.texture(
-            (self.lut_dim, self.lut_dim),
-            components=4,
+            (self.lut_width, self.lut_rows),
+            components=1,
+            dtype="u2",
+            data=memoryview(self.lut_index).cast("B"),
+            filter=(self.ctx.NEAREST, self.ctx.NEAREST),
+        )
+
+        self.group_texture = self.ctx.texture(
+            (self.lut_width, self.lut_rows),
+            components=2,
+            data=memoryview(self.group_data).cast("B"),
+            filter=(self.ctx.NEAREST, self.ctx.NEAREST),
+        )
+
+        self.selection_texture = self.ctx.texture(
+            (self.lut_width, self.lut_rows),
+            components=1,
+            data=memoryview(self.selection_mask),
             filter=(self.ctx.NEAREST, self.ctx.NEAREST),
         )
-        self.lookup_texture.write(self.lut_data.tobytes())
     
     def update_overlay(self, color_map: Dict[int, Tuple[int, int, int]]) -> None:
-        """Update the overlay colors and rebuild LUT."""
-        self._active_color_map = color_map
+        """Legacy dict entry point. Converts to arrays and rebuilds the LUT."""
+        # Both arrays are filled straight from the dict views (no intermediate
+        # list of tuples); the rebuild itself is a vectorized scatter.
+        n = len(color_map)
+        ids = np.fromiter(color_map.keys(), dtype=np.int64, count=n)
+        rgb = np.fromiter(
+            itertools.chain.from_iterable(color_map.values()), dtype=np.uint8, count=n * 3
+        ).reshape(-1, 3)
+        self.update_overlay_arrays(ids, rgb)
+
+    def update_overlay_arrays(self, ids: np.ndarray, rgb: np.ndarray) -> None:
+        """
+        Update the overlay colors from parallel (ids, rgb) arrays and rebuild LUT.
+        Skipped entirely when the content equals the previous call's
+        (e.g. a periodic refresh while nothing changed).
+        """
+        ids = np.ascontiguousarray(ids)
+        rgb = np.ascontiguousarray(rgb, dtype=np.uint8).reshape(-1, 3)
+
+        digest = self._overlay_content_digest(ids, rgb)
+        if digest == self._overlay_digest:
+            return
+        self._overlay_digest = digest
+
+        index, palette = build_palette(rgb)
+        self._set_overlay(ids, index, palette)
+
+    @staticmethod
+    def _overlay_content_digest(ids: np.ndarray, rgb: np.ndarray) -> bytes:
+        """Hashes the raw buffers (no bytes copies) plus dtype/length."""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{ids.dtype.str}:{ids.size}".encode())
+        h.update(memoryview(ids).cast("B"))
+        h.update(memoryview(rgb).cast("B"))
+        return h.digest()
+
+    def _set_overlay(self, ids: np.ndarray, index: np.ndarray, palette: np.ndarray) -> None:
+        """Stores (ids, palette index) + packed palette, rebuilds and uploads both."""
+        self._active_ids = ids
+        self._active_index = index
+        self._upload_palette(palette)
         self._rebuild_lut_array()
-        if self.lookup_texture:
-            self.lookup_texture.write(self.lut_data.tobytes())
+        self._upload_lut()
     
-    def update_selection(self, multi_select_dense_ids: Set[int]) -> None:
-        """Update selection highlighting in the LUT."""
-        self.prev_multi_select_dense_ids = self.multi_select_dense_ids.copy()
+    def update_region_groups(self, ids: np.ndarray, groups: np.ndarray) -> None:
+        """
+        Assigns a group id (1..65535) to each real region id and uploads the
+        group texture. Regions not listed fall back to group 0.
+        """
+        self.group_data.fill(0)
+
+        dense_ids = self.to_dense_ids(ids)
+        valid = (dense_ids > 0) & (dense_ids < len(self.group_data))
+        groups = np.asarray(groups, dtype=np.uint16)[valid]
+        dense_ids = dense_ids[valid]
+
+        self.group_data[dense_ids, 0] = groups & 0xFF
+        self.group_data[dense_ids, 1] = groups >> 8
+
+        if self.group_texture:
+            rows = self._used_lut_rows()
+            self.group_texture.write(
+                memoryview(self.group_data[:rows * self.lut_width]).cast("B"),
+                viewport=(0, 0, self.lut_width, rows),
+            )
+
+    def update_selection(self, multi_select_dense_ids: np.ndarray) -> None:
+        """
+        Update multi-selection highlighting (selection mask only, LUT untouched).
+        'multi_select_dense_ids' must be sorted and unique (e.g. from np.unique).
+        """
+        self.prev_multi_select_dense_ids = self.multi_select_dense_ids
         self.multi_select_dense_ids = multi_select_dense_ids
         self._update_selection_texture()
     
-    def bind_textures(self, program: arcade.gl.Program) -> None:
-        """Bind all textures to the shader program."""
+    def bind_textures(self) -> None:
+        """
+        Bind all textures to their units (0 map, 1 lookup, 2 terrain, 3 group,
+        4 selection, 5 palette).
+        The sampler uniforms pointing at these units are set once at shader init.
+        """
         if self.map_texture:
             self.map_texture.use(0)
-            program["u_map_texture"] = 0
         
         if self.lookup_texture:
             self.lookup_texture.use(1)
-            program["u_lookup_texture"] = 1
         
         if self.terrain_texture:
             self.terrain_texture.use(2)
-            program["u_terrain_texture"] = 2
+
+        if self.group_texture:
+            self.group_texture.use(3)
+
+        if self.selection_texture:
+            self.selection_texture.use(4)
+
+        if self.palette_texture:
+            self.palette_texture.use(5)
     
     def set_uniforms(self, program: arcade.gl.Program) -> None:
         """Set texture-related uniforms."""
-        program["u_lut_dim"] = float(self.lut_dim)
+        program["u_lut_dim"] = float(self.lut_width)
     
     # Private methods
     @staticmethod
-    def _load_image_rgba_flipped(path: Path) -> Tuple[int, int, bytes]:
-        """Load image as RGBA and flip vertically."""
+    def _load_image_pixels(path: Path) -> Tuple[int, int, np.ndarray]:
+        """
+        Load image as a contiguous (H, W, 3|4) uint8 array in image row order
+        (top row first; the shader flips v when sampling).
+        RGB and RGBA images are used as decoded; only other modes (palette,
+        greyscale...) pay for a conversion pass to RGBA.
+        np.array makes the one writable copy: np.asarray would hand back PIL's
+        read-only buffer, which arcade's memoryview upload rejects.
+        The PIL image (file handle + decoder state) is closed before returning.
+        """
         Image.MAX_IMAGE_PIXELS = None
-        img = Image.open(path).convert("RGBA")
-        arr = np.array(img, dtype=np.uint8)
-        arr = np.flipud(arr)
+        with Image.open(path) as img:
+            if img.mode not in ("RGB", "RGBA"):
+                img = img.convert("RGBA")
+            arr = np.array(img)
         h, w, _ = arr.shape
-        return w, h, arr.tobytes()
+        return w, h, arr
     
+    def _build_real_to_dense_table(self) -> None:
+        """
+        Builds the flat real -> dense table when the id range is small enough.
+        Wide id ranges (e.g. full 24-bit color keys) keep the binary search instead.
+        """
+        known = self.dense_to_real
+        self._real_to_dense_arr = None
+        if known.size == 0 or known[0] < 0:
+            return
+
+        size = int(known[-1]) + 1
+        if size > MAX_FLAT_ID_LOOKUP:
+            return
+
+        table = np.full(size, -1, dtype=np.int32)
+        table[known] = np.arange(known.size, dtype=np.int32)
+        self._real_to_dense_arr = table
+
+    def to_dense_ids(self, real_ids: np.ndarray) -> np.ndarray:
+        """
+        Vectorized real -> dense id conversion. Unknown ids map to -1.
+        Uses the flat table when available (one gather), otherwise a binary
+        search: 'dense_to_real' comes from np.unique, so it is sorted.
+        """
+        real_ids = np.asarray(real_ids)
+        known = self.dense_to_real
+        if known.size == 0 or real_ids.size == 0:
+            return np.full(real_ids.shape, -1, dtype=np.int64)
+
+        table = self._real_to_dense_arr
+        if table is not None:
+            in_range = (real_ids >= 0) & (real_ids < table.size)
+            return np.where(in_range, table[np.where(in_range, real_ids, 0)], -1)
+
+        pos = np.searchsorted(known, real_ids)
+        pos = np.minimum(pos, known.size - 1)
+        return np.where(known[pos] == real_ids, pos, -1)
+
     def _rebuild_lut_array(self) -> None:
         """Rebuild the LUT array from current color mappings."""
-        self.lut_data.fill(0)
-        for real_id, color in self._active_color_map.items():
-            if real_id in self.real_to_dense:
-                dense_id = self.real_to_dense[real_id]
-                if 0 < dense_id < len(self.lut_data):
-                    alpha = 255 if dense_id in self.multi_select_dense_ids else 200
-                    self.lut_data[dense_id] = [color[0], color[1], color[2], alpha]
+        # Reuse the persistent buffer (sized to the texture by init_lookup_texture)
+        lut = self.lut_index
+        ids = self._active_ids
+
+        # Same regions as last time (e.g. a color-only refresh): reuse the
+        # translated rows, only the palette indexes are new
+        cached = self._lut_rows_cache
+        if cached is not None and np.array_equal(cached[0], ids):
+            _, valid, rows = cached
+        else:
+            dense_ids = self.to_dense_ids(ids)
+            valid = (dense_ids > 0) & (dense_ids < len(lut))
+            rows = dense_ids[valid]
+            self._lut_rows_cache = (ids, valid, rows)
+
+        # Single scatter for all palette indexes
+        fill_lut(lut, rows, self._active_index[valid])
     
     def _update_selection_texture(self) -> None:
-        """Update selection highlighting in the LUT texture."""
-        # Reset previous selections to normal alpha
-        for idx in self.prev_multi_select_dense_ids:
-            if 0 < idx < len(self.lut_data) and self.lut_data[idx, 3] > 0:
-                self.lut_data[idx, 3] = 200
-        
-        # Highlight current selections
-        for idx in self.multi_select_dense_ids:
-            if 0 < idx < len(self.lut_data) and self.lut_data[idx, 3] > 0:
-                self.lut_data[idx, 3] = 255
-        
+        """Update the selection mask texture from the last selection change."""
+        old, new = self.prev_multi_select_dense_ids, self.multi_select_dense_ids
+
+        # 1. Only ids whose state flipped are touched (both arrays are unique)
+        to_clear = np.setdiff1d(old, new, assume_unique=True)
+        to_set = np.setdiff1d(new, old, assume_unique=True)
+
+        # 2. Keep valid rows (id 0 is never highlighted)
+        mask = self.selection_mask
+        to_clear = to_clear[(to_clear > 0) & (to_clear < len(mask))]
+        to_set = to_set[(to_set > 0) & (to_set < len(mask))]
+
+        mask[to_clear] = 0
+        mask[to_set] = 255
+
+        # 3. Only the changed texels are re-uploaded
+        changed = np.concatenate((to_clear, to_set))
+        if changed.size and self.selection_texture:
+            self._upload_texels(self.selection_texture, mask, changed)
+
+    def _upload_texels(self, texture: arcade.gl.Texture, data: np.ndarray, dense_ids: np.ndarray) -> None:
+        """
+        Uploads only the given texels of a LUT-shaped texture ('data' holds one
+        element per dense id), coalesced into contiguous runs. Each run is split
+        at row boundaries and sent as one 1-pixel-high sub-image write.
+        Large or scattered sets fall back to a row-span upload.
+        """
+        ids = np.unique(dense_ids)
+        ids = ids[(ids >= 0) & (ids < len(data))]
+        if ids.size == 0:
+            return
+
+        # 1. Split into runs of consecutive ids, breaking at row starts too
+        breaks = (np.diff(ids) != 1) | (ids[1:] % self.lut_width == 0)
+        starts = np.concatenate(([0], np.flatnonzero(breaks) + 1))
+        if starts.size > MAX_LUT_SUB_UPLOADS:
+            self._upload_rows(texture, data, int(ids[0]) // self.lut_width, int(ids[-1]) // self.lut_width + 1)
+            return
+
+        ends = np.append(starts[1:], ids.size)
+
+        # 2. One write per run, straight from the persistent buffer (no bytes copy)
+        for start, end in zip(ids[starts].tolist(), (ids[ends - 1] + 1).tolist()):
+            y, x = divmod(start, self.lut_width)
+            texture.write(
+                memoryview(data[start:end]).cast("B"),
+                viewport=(x, y, end - start, 1),
+            )
+
+    def _used_lut_rows(self) -> int:
+        """Number of LUT rows that can hold a region (dense ids are 0..N-1)."""
+        return self.lut_rows
+
+    def _upload_lut(self, first_row: int = 0, end_row: Optional[int] = None) -> None:
+        """
+        Uploads LUT rows [first_row, end_row) with a sub-image write.
+        By default that is every row of the (region-count sized) texture.
+        """
         if self.lookup_texture:
-            self.lookup_texture.write(self.lut_data.tobytes())
+            self._upload_rows(self.lookup_texture, self.lut_index, first_row, end_row)
+
+    def _upload_rows(
+        self,
+        texture: arcade.gl.Texture,
+        data: np.ndarray,
+        first_row: int = 0,
+        end_row: Optional[int] = None,
+    ) -> None:
+        """Uploads rows [first_row, end_row) of a LUT-shaped texture from 'data'."""
+        used_rows = self._used_lut_rows()
+        end_row = used_rows if end_row is None else min(end_row, used_rows)
+        first_row = max(0, first_row)
+        if end_row <= first_row:
+            return
+
+        rows = data[first_row * self.lut_width:end_row * self.lut_width]
+        texture.write(
+            memoryview(rows).cast("B"),
+            viewport=(0, first_row, self.lut_width, end_row - first_row),
+        )
+
+    def _upload_palette(self, palette: np.ndarray) -> None:
+        """
+        Uploads the packed RGBA palette. The texture is PALETTE_WIDTH texels wide
+        and only reallocated when it needs more rows (grown to a power of two).
+        Every other overlay refresh is an in-place sub-upload into the same texture.
+        """
+        size = int(palette.size)
+        rows = max(1, -(-size // PALETTE_WIDTH))
+
+        if self.palette_texture is None or self.palette_texture.height < rows:
+            capacity_rows = 1 << (rows - 1).bit_length()
+            if self.palette_texture is not None:
+                # Free the outgrown allocation now instead of leaving it to GC
+                self.palette_texture.delete()
+            self.palette_u32 = np.zeros(capacity_rows * PALETTE_WIDTH, dtype=np.uint32)
+            self.palette_texture = self.ctx.texture(
+                (PALETTE_WIDTH, capacity_rows),
+                components=4,
+                filter=(self.ctx.NEAREST, self.ctx.NEAREST),
+            )
+
+        self.palette_u32[:size] = palette
+        self.palette_u32[size:rows * PALETTE_WIDTH] = 0
+        self.palette_size = size
+        self.palette_texture.write(
+            memoryview(self.palette_u32[:rows * PALETTE_WIDTH]).cast("B"),
+            viewport=(0, 0, PALETTE_WIDTH, rows),
+        )
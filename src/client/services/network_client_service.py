@@ -1,3 +1,4 @@
+import dataclasses
 from typing import TYPE_CHECKING
 from src.shared.actions import GameAction
 
@@ -17,22 +18,31 @@ class NetworkClient:
         # In a real networked game, this ID comes from the handshake
         self.player_id = "local_admin" 
 
+        # Session endpoints bound once: every call below is a single direct
+        # call instead of a session lookup + method bind per action/frame.
+        # A remote client would bind its transport functions here instead.
+        self._receive_action = session.receive_action
+        self._get_state_snapshot = session.get_state_snapshot
+        self._save_map_changes = session.save_map_changes
+
     def send_action(self, action: GameAction):
         """
         Sends an intent to the server.
         The client NEVER applies this action locally. It waits for the 
         server to process it and send back a new State.
         """
-        action.player_id = self.player_id
-        self.session.receive_action(action)
+        # Actions are frozen; tag a copy only when the sender differs
+        if action.player_id != self.player_id:
+            action = dataclasses.replace(action, player_id=self.player_id)
+        self._receive_action(action)
 
     def get_state(self) -> "GameState":
         """
         Fetches the latest authoritative world state.
         """
-        return self.session.get_state_snapshot()
+        return self._get_state_snapshot()
 
     def request_save(self):
         """Editor-specific command."""
         print("[NetworkClient] Requesting server to save map data...")
-        self.session.save_map_changes()
\ No newline at end of file
+        self._save_map_changes()
\ No newline at end of file
@@ -1,12 +1,16 @@
-import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
 from src.server.session import GameSession
 from src.shared.config import GameConfig
 
 # UPDATED: Import Core Data class instead of Shared Atlas
 from src.core.map_data import RegionMapData
 from src.client.services.network_client_service import NetworkClient
+from src.client.renderers.texture_manager import TextureManager
 
 @dataclass
 class EditorContext:
@@ -18,6 +22,7 @@ class EditorContext:
     terrain_path: Path      # Path to the artistic background (terrain)
     map_data: RegionMapData # Pre-calculated OpenCV/NumPy data (CPU Only)
     net_client: NetworkClient
+    terrain_pixels: Optional[np.ndarray] = None # Decoded terrain (None if missing)
 
 class EditorLoadingTask:
     """
@@ -42,30 +47,34 @@ class EditorLoadingTask:
         Executed in background thread by LoadingView.
         """
         # 1. Locate Map Assets
+        # No sleep before the heavy step: LoadingView polls progress/status_text
+        # every frame, so the UI repaints on its own while we work.
         self.status_text = "Locating map assets..."
         self.progress = 0.1
         
         map_path = self._resolve_map_path()
-        terrain_path = self._resolve_terrain_path()
-        
-        # Brief sleep ensures the UI thread has a chance to render the text update
-        # before the heavy CPU blocking operation starts.
-        time.sleep(0.1) 
 
-        # 2. Load Region Data (Heavy CPU Work)
-        self.status_text = "Processing Region Data (CV2)..."
-        self.progress = 0.3
-        
-        # UPDATED: We use the Core class. 
-        # This is safe to run in a thread because it touches no OpenGL context.
-        # It just does math on pixels.
-        map_data = RegionMapData(str(map_path))
-        
-        # 3. Initialize Network
-        self.status_text = "Connecting to Session..."
-        self.progress = 0.8
-        
-        net_client = NetworkClient(self.session)
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="editor_load") as pool:
+            # Terrain decode and session setup overlap with the region build
+            # instead of running before/after it.
+            terrain_future = pool.submit(self._load_terrain)
+            net_future = pool.submit(NetworkClient, self.session)
+
+            # 2. Load Region Data (Heavy CPU Work)
+            self.status_text = "Processing Region Data (CV2)..."
+            self.progress = 0.3
+            
+            # UPDATED: We use the Core class. 
+            # This is safe to run in a thread because it touches no OpenGL context.
+            # It just does math on pixels.
+            map_data = RegionMapData(str(map_path), self.config.cache_dir)
+            
+            # 3. Initialize Network (already done by now; result() re-raises errors)
+            self.status_text = "Connecting to Session..."
+            self.progress = 0.8
+            
+            terrain_path, terrain_pixels = terrain_future.result()
+            net_client = net_future.result()
         
         # 4. Finalize
         self.status_text = "Finalizing..."
@@ -75,7 +84,8 @@ class EditorLoadingTask:
             map_path=map_path,
             terrain_path=terrain_path,
             map_data=map_data,
-            net_client=net_client
+            net_client=net_client,
+            terrain_pixels=terrain_pixels
         )
 
     def _resolve_map_path(self) -> Path:
@@ -96,6 +106,17 @@ class EditorLoadingTask:
         # Fallback to root (Critical error usually, but we return a path to fail gracefully later)
         return self.config.project_root / "missing_map_placeholder.png"
 
+    def _load_terrain(self) -> Tuple[Path, Optional[np.ndarray]]:
+        """
+        Resolves and decodes the terrain image off the main thread, so opening
+        the editor only pays for the GPU upload. Pixels are None if the file
+        is missing (the renderer reports it when it loads the path itself).
+        """
+        terrain_path = self._resolve_terrain_path()
+        if not terrain_path.exists():
+            return terrain_path, None
+        return terrain_path, TextureManager.decode_terrain(terrain_path)
+
     def _resolve_terrain_path(self) -> Path:
         """
         Finds the artistic terrain background.
@@ -1,5 +1,5 @@
 import arcade
-from typing import Optional
+from typing import Optional, List, Tuple
 from imgui_bundle import imgui, icons_fontawesome_6
 
 from src.client.ui.composer import UIComposer
@@ -13,13 +13,30 @@ class CentralBar:
     HUD component displayed at the bottom of the screen.
     Handles country info, time controls, and quick actions.
     """
+    # Per-frame constants, built once instead of on every render
+    QUICK_ACTIONS = (
+        (icons_fontawesome_6.ICON_FA_BRAIN, "AI"),
+        (icons_fontawesome_6.ICON_FA_CHART_LINE, "Statistics"),
+        (icons_fontawesome_6.ICON_FA_ENVELOPE, "Messages"),
+    )
+    SPEED_BTN_SIZE = (26, 26)
+    SPEED_LEVELS = tuple(enumerate(("1", "2", "3", "4", "5"), start=1))  # (level, label)
+
     def __init__(self):
         self.show_speed_controls = True 
         self.news_ticker_text = "Global News: Simulation initialized and running."
         
         self.flag_renderer = FlagRenderer()
         self.active_tag = "" 
+        self._tag_label = "  " # Button label for active_tag, rebuilt only when the tag changes
         self.is_own = True
+
+        # Quick action button size, rebuilt only when the bar height changes
+        self._quick_btn_sz = (0.0, 0.0)
+
+        # Country selector rows [(tag, label)], tied to the 'countries' frame they came from
+        self._country_rows_src = None
+        self._country_rows: List[Tuple[str, str]] = []
         
         # Used to pass the popup selection back to the layout
         self._switch_request: Optional[str] = None
@@ -29,25 +46,41 @@ class CentralBar:
         self.top_section_h_pct = 0.65       
         self.content_scale_factor = 0.80    
 
+        # Dirty-flag caches: derived layout / text is recomputed only when its
+        # inputs change. ImGui itself must still get every widget each frame
+        # (immediate mode keeps nothing), but the math and string work feeding
+        # it is skipped while the HUD is unchanged.
+        self._window_key = None
+        self._window_geom = ((0.0, 0.0), (0.0, 0.0))    # (pos, size)
+        self._sections_key = None
+        self._sections = None                           # see _get_sections
+        self._date_key = None
+        self._date_parts = ("N/A", "", (0.0, 0.0))      # (date, time, cursor pos)
+
     def render(self, composer: UIComposer, state, net: NetworkClient, target_tag: str, is_own_country: bool) -> Optional[str]:
         """
         Renders the bar.
         Returns: A string (Country Tag) if the user selected a new country from the popup, else None.
         """
-        self.active_tag = target_tag
+        if target_tag != self.active_tag:
+            self.active_tag = target_tag
+            self._tag_label = f" {target_tag} "
         self.is_own = is_own_country
         self._switch_request = None # Reset request
         
         viewport = imgui.get_main_viewport()
-        screen_w = viewport.size.x
-        screen_h = viewport.size.y
-        
-        bar_width = max(700.0, min(screen_w * 0.40, 800.0))
-        pos_x = (screen_w - bar_width) / 2
-        pos_y = screen_h - self.height - 15 
+        window_key = (viewport.size.x, viewport.size.y, self.height)
+        if window_key != self._window_key:
+            screen_w, screen_h, bar_h = window_key
+            bar_width = max(700.0, min(screen_w * 0.40, 800.0))
+            pos_x = (screen_w - bar_width) / 2
+            pos_y = screen_h - bar_h - 15 
+            self._window_geom = ((pos_x, pos_y), (bar_width, bar_h))
+            self._window_key = window_key
 
-        imgui.set_next_window_pos((pos_x, pos_y))
-        imgui.set_next_window_size((bar_width, self.height))
+        window_pos, window_size = self._window_geom
+        imgui.set_next_window_pos(window_pos)
+        imgui.set_next_window_size(window_size)
         imgui.push_style_var(imgui.StyleVar_.window_padding, (0, 0))
 
         flags = (imgui.WindowFlags_.no_decoration | 
@@ -61,43 +94,29 @@ class CentralBar:
                 p = imgui.get_cursor_screen_pos()
                 w = imgui.get_window_width()
                 h = imgui.get_window_height()
-                top_h = h * self.top_section_h_pct
-                ticker_h = h - top_h
+                (top_h, ticker_h, inner_item_h, right_section_w, btn_spacing,
+                 left_pos, right_pos, center_pos, ticker_pos) = self._get_sections(w, h)
 
                 # Draw backgrounds
-                draw_list.add_rect_filled(p, (p.x + w, p.y + top_h), imgui.get_color_u32(GAMETHEME.col_panel_bg), GAMETHEME.rounding, imgui.ImDrawFlags_.round_corners_top)
-                draw_list.add_rect_filled((p.x, p.y + top_h), (p.x + w, p.y + h), imgui.get_color_u32(GAMETHEME.col_overlay_bg), GAMETHEME.rounding, imgui.ImDrawFlags_.round_corners_bottom)
-                draw_list.add_rect(p, (p.x + w, p.y + h), imgui.get_color_u32(GAMETHEME.border), GAMETHEME.rounding, 0, 1.5)
-
-                padding_x = 12.0
-                inner_item_h = top_h * self.content_scale_factor
-                content_y = (top_h - inner_item_h) / 2
-                left_section_w = 200.0  
-                right_section_w = 250.0 
+                draw_list.add_rect_filled(p, (p.x + w, p.y + top_h), GAMETHEME.u32(GAMETHEME.col_panel_bg), GAMETHEME.rounding, imgui.ImDrawFlags_.round_corners_top)
+                draw_list.add_rect_filled((p.x, p.y + top_h), (p.x + w, p.y + h), GAMETHEME.u32(GAMETHEME.col_overlay_bg), GAMETHEME.rounding, imgui.ImDrawFlags_.round_corners_bottom)
+                draw_list.add_rect(p, (p.x + w, p.y + h), GAMETHEME.u32(GAMETHEME.border), GAMETHEME.rounding, 0, 1.5)
 
                 # 1. Left Section: Country Flag & Info
-                imgui.set_cursor_pos((padding_x, content_y))
+                imgui.set_cursor_pos(left_pos)
                 self._render_country_info(composer, inner_item_h)
 
                 # 2. Right Section: Time Controls
-                right_start_x = w - right_section_w - padding_x
-                imgui.set_cursor_pos((right_start_x, content_y))
+                imgui.set_cursor_pos(right_pos)
                 self._render_time_controls(state, net, right_section_w, inner_item_h)
 
                 # 3. Center Section: Quick Actions
-                btn_count = 3
-                btn_spacing = 10.0
-                center_grp_w = (inner_item_h * btn_count) + (btn_spacing * (btn_count - 1))
-                available_space_start = left_section_w + padding_x
-                available_space_end = right_start_x
-                center_x = available_space_start + ((available_space_end - available_space_start) - center_grp_w) / 2
-                
-                imgui.set_cursor_pos((center_x, content_y))
+                imgui.set_cursor_pos(center_pos)
                 self._render_quick_actions(inner_item_h, btn_spacing)
 
                 # 4. Bottom Section: News Ticker
                 # Set cursor to start of bottom section
-                imgui.set_cursor_pos((0, top_h))
+                imgui.set_cursor_pos(ticker_pos)
                 self._render_ticker(w, ticker_h)
 
                 # 5. Popups
@@ -113,6 +132,38 @@ class CentralBar:
         imgui.pop_style_var() 
         return self._switch_request
 
+    def _get_sections(self, w: float, h: float) -> tuple:
+        """Section sizes and cursor positions inside the bar, recomputed only when its size changes."""
+        key = (w, h, self.top_section_h_pct, self.content_scale_factor)
+        if key != self._sections_key:
+            top_h = h * self.top_section_h_pct
+            ticker_h = h - top_h
+
+            padding_x = 12.0
+            inner_item_h = top_h * self.content_scale_factor
+            content_y = (top_h - inner_item_h) / 2
+            left_section_w = 200.0  
+            right_section_w = 250.0 
+
+            right_start_x = w - right_section_w - padding_x
+
+            btn_count = len(self.QUICK_ACTIONS)
+            btn_spacing = 10.0
+            center_grp_w = (inner_item_h * btn_count) + (btn_spacing * (btn_count - 1))
+            available_space_start = left_section_w + padding_x
+            available_space_end = right_start_x
+            center_x = available_space_start + ((available_space_end - available_space_start) - center_grp_w) / 2
+
+            self._sections = (
+                top_h, ticker_h, inner_item_h, right_section_w, btn_spacing,
+                (padding_x, content_y),         # left
+                (right_start_x, content_y),     # right
+                (center_x, content_y),          # center
+                (0, top_h),                     # ticker
+            )
+            self._sections_key = key
+        return self._sections
+
     def _render_time_controls(self, state, net, width, height):
         imgui.begin_group()
         try:
@@ -123,14 +174,14 @@ class CentralBar:
             screen_w = width - 50 - imgui.get_style().item_spacing.x
             p = imgui.get_cursor_screen_pos()
             draw_list = imgui.get_window_draw_list()
-            draw_list.add_rect_filled(p, (p.x + screen_w, p.y + height), imgui.get_color_u32(GAMETHEME.col_black))
-            draw_list.add_rect(p, (p.x + screen_w, p.y + height), imgui.get_color_u32(GAMETHEME.border))
+            draw_list.add_rect_filled(p, (p.x + screen_w, p.y + height), GAMETHEME.u32(GAMETHEME.col_black))
+            draw_list.add_rect(p, (p.x + screen_w, p.y + height), GAMETHEME.u32(GAMETHEME.border))
             
             imgui.begin_child("TimeScreen", (screen_w, height), False, imgui.WindowFlags_.no_background)
             
             if self.show_speed_controls:
                 # Center the buttons vertically within the child
-                btn_h = 26
+                btn_h = self.SPEED_BTN_SIZE[1]
                 imgui.set_cursor_pos((10, (height - btn_h) / 2))
                 self._draw_speed_buttons(state, net)
             else:
@@ -140,9 +191,10 @@ class CentralBar:
             imgui.end_group()
 
     def _draw_speed_buttons(self, state, net):
-        current_speed = getattr(state.time, "speed", 1)
-        is_paused = getattr(state.time, "paused", False)
-        btn_s = (26, 26) 
+        # TimeData is a typed dataclass: plain attribute reads, no getattr fallback
+        current_speed = state.time.speed_level
+        is_paused = state.time.is_paused
+        btn_s = self.SPEED_BTN_SIZE
         imgui.push_style_var(imgui.StyleVar_.item_spacing, (2, 0))
         imgui.push_style_var(imgui.StyleVar_.frame_padding, (0, 0))
         
@@ -156,35 +208,45 @@ class CentralBar:
         if is_paused: imgui.pop_style_color(2)
         imgui.same_line()
 
-        for i in range(1, 6):
-            is_active = (current_speed == i and not is_paused)
+        # The highlighted level is decided once per frame (none while paused)
+        active_level = 0 if is_paused else current_speed
+        last_level = self.SPEED_LEVELS[-1][0]
+        for i, label in self.SPEED_LEVELS:
+            is_active = (i == active_level)
             if is_active: 
                 imgui.push_style_color(imgui.Col_.button, GAMETHEME.col_positive)
                 imgui.push_style_color(imgui.Col_.text, GAMETHEME.col_black)
-            if imgui.button(str(i), btn_s):
+            if imgui.button(label, btn_s):
                 net.send_action(ActionSetPaused("local", False))
                 net.send_action(ActionSetGameSpeed("local", i))
             if is_active: imgui.pop_style_color(2)
-            if i < 5: imgui.same_line()
+            if i < last_level: imgui.same_line()
         imgui.pop_style_var(2)
 
     def _draw_date_display(self, state, avail_w, avail_h):
         t = state.time
-        parts = t.date_str.split(" ")
-        date_part = parts[0] if len(parts) > 0 else "N/A"
-        time_part = parts[1] if len(parts) > 1 else ""
-        
-        full_text = f"{date_part}   {time_part}"
-        
-        # Calculate size to center perfectly
-        text_size = imgui.calc_text_size(full_text)
-        text_w = text_size.x
-        text_h = text_size.y
-        
-        pos_x = (avail_w - text_w) / 2
-        pos_y = (avail_h - text_h) / 2
-        
-        imgui.set_cursor_pos((pos_x, pos_y))
+        # The split, the formatting and the text measurement only rerun when
+        # the date string (changes once per game minute) or the area changes.
+        date_key = (t.date_str, avail_w, avail_h)
+        if date_key != self._date_key:
+            parts = t.date_str.split(" ")
+            date_part = parts[0] if len(parts) > 0 else "N/A"
+            time_part = parts[1] if len(parts) > 1 else ""
+            
+            full_text = f"{date_part}   {time_part}"
+            
+            # Calculate size to center perfectly
+            text_size = imgui.calc_text_size(full_text)
+            text_w = text_size.x
+            text_h = text_size.y
+            
+            pos_x = (avail_w - text_w) / 2
+            pos_y = (avail_h - text_h) / 2
+            self._date_parts = (date_part, time_part, (pos_x, pos_y))
+            self._date_key = date_key
+
+        date_part, time_part, cursor_pos = self._date_parts
+        imgui.set_cursor_pos(cursor_pos)
         
         # Draw with color logic
         imgui.text_colored(GAMETHEME.col_positive, date_part)
@@ -207,7 +269,7 @@ class CentralBar:
                 row_h = (height - gap) / 2
                 
                 # Top Row: Country Tag (Click to open switcher)
-                if imgui.button(f" {self.active_tag} ", (90, row_h)):
+                if imgui.button(self._tag_label, (90, row_h)):
                     imgui.open_popup("CountrySelectorPopup")
                 
                 # Bottom Row: Status Indicator
@@ -231,16 +293,16 @@ class CentralBar:
         if not self.is_own:
             imgui.begin_disabled()
 
-        btn_sz = (height, height)
+        if self._quick_btn_sz[0] != height:
+            self._quick_btn_sz = (height, height)
+        btn_sz = self._quick_btn_sz
+
         imgui.push_style_var(imgui.StyleVar_.item_spacing, (spacing, 0))
-        if imgui.button(f"{icons_fontawesome_6.ICON_FA_BRAIN}", btn_sz): pass
-        if imgui.is_item_hovered(): imgui.set_tooltip("AI")
-        imgui.same_line()
-        if imgui.button(f"{icons_fontawesome_6.ICON_FA_CHART_LINE}", btn_sz): pass
-        if imgui.is_item_hovered(): imgui.set_tooltip("Statistics")
-        imgui.same_line()
-        if imgui.button(f"{icons_fontawesome_6.ICON_FA_ENVELOPE}", btn_sz): pass
-        if imgui.is_item_hovered(): imgui.set_tooltip("Messages")
+        last = len(self.QUICK_ACTIONS) - 1
+        for i, (icon, tooltip) in enumerate(self.QUICK_ACTIONS):
+            if imgui.button(icon, btn_sz): pass
+            if imgui.is_item_hovered(): imgui.set_tooltip(tooltip)
+            if i < last: imgui.same_line()
         imgui.pop_style_var()
 
         if not self.is_own:
@@ -286,20 +348,12 @@ class CentralBar:
             imgui.separator()
             
             if "countries" in state.tables:
-                df = state.tables["countries"]
-                # Sort alphabetically for better UX
-                try:
-                    df = df.sort("id")
-                except: pass
+                rows = self._get_country_rows(state.tables["countries"])
                 
                 # Use a child window to make it scrollable
                 imgui.begin_child("CountryList", (250, 300), True)
                 
-                for row in df.iter_rows(named=True):
-                    tag = row['id']
-                    name = row.get('name', tag)
-                    label = f"{tag} - {name}"
-                    
+                for tag, label in rows:
                     # Highlight current tag
                     is_selected = (tag == self.active_tag)
                     
@@ -313,6 +367,27 @@ class CentralBar:
                 
             imgui.end_popup()
 
+    def _get_country_rows(self, df) -> List[Tuple[str, str]]:
+        """
+        (tag, "TAG - Name") for every country, sorted by tag.
+        Built once per 'countries' frame (a replaced frame rebuilds it), so the
+        open popup does no Polars iteration or string formatting per frame.
+        """
+        if df is not self._country_rows_src:
+            # Sort alphabetically for better UX
+            try:
+                df_sorted = df.sort("id")
+            except: df_sorted = df
+            
+            rows = []
+            for row in df_sorted.iter_rows(named=True):
+                tag = row['id']
+                name = row.get('name', tag)
+                rows.append((tag, f"{tag} - {name}"))
+            self._country_rows = rows
+            self._country_rows_src = df
+        return self._country_rows
+
     def _draw_status_label(self, label, color, height, width=40):
         imgui.push_style_color(imgui.Col_.button, color)
         imgui.push_style_color(imgui.Col_.text, GAMETHEME.col_black)
@@ -20,9 +20,8 @@ class DemographicsPanel(BasePanel):
         
         if "regions" in state.tables:
             try:
-                df = state.tables["regions"]
-                # Filter by active target (could be foreign)
-                target_regions = df.filter(pl.col("owner") == target_tag)
+                # Rows of the active target (could be foreign); partitioned once per regions frame
+                target_regions = state.get_regions_by_owner(target_tag)
                 
                 if not target_regions.is_empty():
                     pop_14 = target_regions.select(pl.col("pop_14")).sum().item()
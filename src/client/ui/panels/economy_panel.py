@@ -32,9 +32,8 @@ class EconomyPanel(BasePanel):
         total_pop = 0
         if "regions" in state.tables:
             try:
-                df_pop = state.tables["regions"]
-                # Sum population of all regions owned by target
-                target_regions = df_pop.filter(pl.col("owner") == target_tag)
+                # Sum population of all regions owned by target (partitioned once per regions frame)
+                target_regions = state.get_regions_by_owner(target_tag)
                 if not target_regions.is_empty():
                     p14 = target_regions.select(pl.col("pop_14")).sum().item()
                     p1564 = target_regions.select(pl.col("pop_15_64")).sum().item()
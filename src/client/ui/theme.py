@@ -132,11 +132,29 @@ class UITheme:
     # Geometry Defaults
     rounding: float = 4.0 
 
+    # color tuple -> packed ImU32, filled by u32() (cleared by apply_global_styles)
+    _u32_cache: dict = field(default_factory=dict, repr=False, compare=False)
+
+    def u32(self, color: tuple) -> int:
+        """
+        Packed ImU32 for a theme color, for draw-list calls.
+        Converted through ImGui once per color and then served from a dict,
+        instead of one get_color_u32 call per use per frame. Style alpha is
+        fixed at 1.0, so the packed value never changes between frames
+        (use get_color_u32 directly inside begin_disabled blocks).
+        """
+        value = self._u32_cache.get(color)
+        if value is None:
+            value = imgui.get_color_u32(color)
+            self._u32_cache[color] = value
+        return value
+
     def apply_global_styles(self):
         """
         Pushes theme settings to the active ImGui Context.
         """
         style = imgui.get_style()
+        self._u32_cache.clear()
         
         # 1. Geometry & Layout
         style.alpha = 1.0
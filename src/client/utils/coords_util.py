@@ -20,9 +20,13 @@ def calculate_centroid(regions_df: pl.DataFrame, map_height: float) -> Optional[
         return None
         
     # 1. Calculate Average in Image Space (Raw Data)
-    # We use Polars mean() which ignores nulls automatically
-    avg_x = regions_df["center_x"].mean()
-    avg_y = regions_df["center_y"].mean()
+    # We use Polars mean() which ignores nulls automatically.
+    # Both means run in one select (a single Rust-side pass over the frame,
+    # one Python round trip) instead of extracting each column separately.
+    avg_x, avg_y = regions_df.select(
+        pl.col("center_x").mean(),
+        pl.col("center_y").mean(),
+    ).row(0)
     
     if avg_x is None or avg_y is None:
         return None
@@ -1,4 +1,15 @@
 import math
+import numpy as np
+
+# Heatmap stops: (Position, (R, G, B))
+# Blue -> Cyan -> Green -> Yellow -> Red
+HEATMAP_STOPS = (
+    (0.00, (0, 0, 255)),    # Blue (Low)
+    (0.25, (0, 255, 255)),  # Cyan
+    (0.50, (0, 255, 0)),    # Green (Mid)
+    (0.75, (255, 255, 0)),  # Yellow
+    (1.00, (255, 0, 0)),    # Red (High)
+)
 
 def lerp_color(val: float, min_val: float, max_val: float, 
                start_color: tuple[int, int, int], 
@@ -21,14 +32,7 @@ def get_heatmap_color(t: float) -> tuple[int, int, int]:
     """
     t = max(0.0, min(1.0, t))
     
-    # Define stops: (Position, (R, G, B))
-    stops = [
-        (0.00, (0, 0, 255)),    # Blue (Low)
-        (0.25, (0, 255, 255)),  # Cyan
-        (0.50, (0, 255, 0)),    # Green (Mid)
-        (0.75, (255, 255, 0)),  # Yellow
-        (1.00, (255, 0, 0)),    # Red (High)
-    ]
+    stops = HEATMAP_STOPS
     
     # Find which two stops 't' falls between
     for i in range(len(stops) - 1):
@@ -40,4 +44,20 @@ def get_heatmap_color(t: float) -> tuple[int, int, int]:
             local_t = (t - t0) / (t1 - t0)
             return lerp_color(local_t, 0, 1, c0, c1)
             
-    return stops[-1][1]
\ No newline at end of file
+    return stops[-1][1]
+
+def get_heatmap_colors(t: np.ndarray) -> np.ndarray:
+    """
+    Vectorized version of get_heatmap_color.
+    Takes an array of t values (0.0 to 1.0) and returns an (N, 3) uint8 RGB array.
+    NaN inputs are treated as 0.0; callers should stamp their own 'no data' color.
+    """
+    t = np.clip(np.nan_to_num(np.asarray(t, dtype=np.float64)), 0.0, 1.0)
+    positions = [p for p, _ in HEATMAP_STOPS]
+
+    rgb = np.empty((t.shape[0], 3), dtype=np.uint8)
+    for ch in range(3):
+        channel = [c[ch] for _, c in HEATMAP_STOPS]
+        # Truncate like lerp_color's int() so both paths produce identical colors
+        rgb[:, ch] = np.interp(t, positions, channel).astype(np.uint8)
+    return rgb
@@ -34,7 +34,8 @@ class EditorView(BaseImGuiView):
         self.renderer = MapRenderer(
             map_img_path=context.map_path, 
             terrain_img_path=context.terrain_path,
-            map_data=context.map_data
+            map_data=context.map_data,
+            terrain_pixels=context.terrain_pixels
         )
         
         # 4. Camera System
@@ -5,6 +5,7 @@ from src.client.views.base_view import BaseImGuiView
 from typing import Optional
 
 from src.client.renderers.map_renderer import MapRenderer
+from src.client.renderers.flag_renderer import FlagRenderer
 from src.client.ui.layouts.game_layout import GameLayout
 from src.client.controllers.camera_controller import CameraController
 from src.client.controllers.viewport_controller import ViewportController
@@ -48,6 +49,11 @@ class GameView(BaseImGuiView):
             on_selection_change=self.on_selection_changed
         )
 
+        # Decode every country flag now (in parallel) rather than on first hover
+        state = self.net.get_state()
+        if "countries" in state.tables:
+            FlagRenderer().prewarm(state.get_table("countries").get_column("id").to_list())
+
         # Initialize UI Layout
         self.layout = GameLayout(self.net, player_tag, self.viewport_ctrl)
 
@@ -117,7 +117,7 @@ class LoadGameView(BaseImGuiView):
                 engine.register_systems(systems)
                 
                 map_path = self.config.get_asset_path("map/regions.png")
-                map_data = RegionMapData(str(map_path))
+                map_data = RegionMapData(str(map_path), self.config.cache_dir)
                 
                 session = GameSession(
                     self.config, self.loader, exporter, engine, map_data, loaded_state
@@ -6,6 +6,9 @@ from src.client.ui.composer import UIComposer
 from src.client.ui.theme import GAMETHEME
 from src.client.interfaces.loading import LoadingTask
 
+# How fast the displayed progress catches up with the task (fraction of the gap per second)
+PROGRESS_EASE_RATE = 4.0
+
 class LoadingView(arcade.View):
     def __init__(self, 
                  task: LoadingTask, 
@@ -29,6 +32,10 @@ class LoadingView(arcade.View):
         # --- NEW: Sentinel to allow one render frame before switching ---
         self._finalizing_frame_rendered = False 
 
+        # Progress shown by the bar. Eased toward task.progress on the frame
+        # clock, so the bar animates smoothly without tasks sleeping for it.
+        self._displayed_progress = 0.0
+
     def on_show_view(self):
         self.window.background_color = GAMETHEME.col_black
         self.thread.start()
@@ -42,6 +49,9 @@ class LoadingView(arcade.View):
             self.is_finished = True
 
     def on_update(self, delta_time: float):
+        target = self.task.progress
+        self._displayed_progress += (target - self._displayed_progress) * min(1.0, delta_time * PROGRESS_EASE_RATE)
+
         # If thread is done...
         if self.is_finished:
             if self.error:
@@ -76,7 +86,7 @@ class LoadingView(arcade.View):
         
         if self.ui.begin_centered_panel("Loader", screen_w, screen_h, w=400, h=150):
             self.ui.draw_title("PROCESSING")
-            self.ui.draw_progress_bar(self.task.progress, self.task.status_text)
+            self.ui.draw_progress_bar(self._displayed_progress, self.task.status_text)
             
             if self.error:
                 from imgui_bundle import imgui
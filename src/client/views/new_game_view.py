@@ -32,6 +32,12 @@ class NewGameView(BaseImGuiView):
         
         self.selected_country_id: Optional[str] = None
         self.playable_countries = self._fetch_playable_countries()
+        # The list is static while this view is open; pull the ids out once
+        # instead of building a row dict per country every frame.
+        self.playable_ids: list[str] = (
+            self.playable_countries.get_column("id").to_list()
+            if "id" in self.playable_countries.columns else []
+        )
 
     def _fetch_playable_countries(self) -> pl.DataFrame:
         try:
@@ -63,9 +69,8 @@ class NewGameView(BaseImGuiView):
             
             # --- Country List (Left Side) ---
             imgui.begin_child("CountryList", (250, 350), True)
-            if not self.playable_countries.is_empty():
-                for row in self.playable_countries.iter_rows(named=True):
-                    c_id = row['id']
+            if self.playable_ids:
+                for c_id in self.playable_ids:
                     label = f"{c_id}"
                     is_selected = (self.selected_country_id == c_id)
                     if imgui.selectable(label, is_selected)[0]:
@@ -83,4 +83,10 @@ class MainWindow(arcade.Window):
     def on_update(self, delta_time: float):
         """Global game tick."""
         if self.session:
-            self.session.tick(delta_time)
\ No newline at end of file
+            self.session.tick(delta_time)
+
+    def on_close(self):
+        """Stops the simulation's worker threads before the window goes away."""
+        if self.session:
+            self.session.shutdown()
+        super().on_close()
\ No newline at end of file
@@ -1,32 +1,101 @@
+import os
 import cv2
 import numpy as np
+from pathlib import Path
+from typing import Optional
+
+from src.core.map_indexer import compute_file_hash
 
 class RegionMapData:
     """
     PURE DATA. Safe for Server and Client.
     Responsible for: Loading the image and providing ID lookups.
     """
-    def __init__(self, image_path: str):
+    def __init__(self, image_path: str, cache_dir: Optional[Path] = None):
+        """
+        'cache_dir' (optional): where the packed id map is cached, together with
+        the image's content hash. Opening an unchanged map then reads one .npz
+        archive instead of decoding and repacking the PNG.
+        """
+        image = Path(image_path)
+        cache_path = cache_dir / f"{image.stem}_packed.npz" if cache_dir and image.exists() else None
+        # Same digest MapIndexer uses (memoized, so the file is hashed once)
+        current_hash = compute_file_hash(image) if cache_path else None
+
+        packed = self._load_cache(cache_path, current_hash) if cache_path else None
+        if packed is None:
+            packed = self._decode(image_path)
+            if cache_path:
+                self._save_cache(cache_path, packed, current_hash)
+
+        self.packed_map = packed
+        self.height, self.width = packed.shape
+
+    @staticmethod
+    def _decode(image_path: str) -> np.ndarray:
         # cv2.imread is safe on a headless server
-        self.raw_img = cv2.imread(image_path)
-        if self.raw_img is None:
+        img = cv2.imread(image_path)
+        if img is None:
             raise FileNotFoundError(f"Missing map: {image_path}")
-        
-        self.height, self.width, _ = self.raw_img.shape
-        
-        # Convert BGR image to a 2D array of Region IDs
+
+        height, width, _ = img.shape
+
+        # Convert BGR image to a 2D array of Region IDs: (R << 16) | (G << 8) | B
         # (This is pure math/logic, perfectly fine for Core)
-        b, g, r = cv2.split(self.raw_img)
-        self.packed_map = b.astype(np.int32) | (g.astype(np.int32) << 8) | (r.astype(np.int32) << 16)
+        # Built in place in one preallocated int32 array straight from the
+        # channel views: no cv2.split copies and no per-channel temporaries.
+        packed = np.empty((height, width), dtype=np.int32)
+        packed[...] = img[..., 2]
+        np.left_shift(packed, 8, out=packed)
+        np.bitwise_or(packed, img[..., 1], out=packed)
+        np.left_shift(packed, 8, out=packed)
+        np.bitwise_or(packed, img[..., 0], out=packed)
+
+        # The raw image is freed on return, we only need the ID array now
+        return packed
+
+    # --- Disk cache ---
 
-        # Free memory of the raw image, we only need the ID array now
-        del b, g, r
-        del self.raw_img
+    @staticmethod
+    def _load_cache(cache_path: Path, current_hash: str) -> Optional[np.ndarray]:
+        """Returns the cached id map, or None if missing or built from another image."""
+        if not cache_path.exists():
+            return None
+        try:
+            with np.load(cache_path, allow_pickle=False) as data:
+                if str(data["hash"]) != current_hash:
+                    print("[RegionMapData] Cache outdated (hash mismatch).")
+                    return None
+                packed = data["packed"]
+            if packed.dtype != np.int32 or packed.ndim != 2:
+                print("[RegionMapData] Cache outdated (layout mismatch).")
+                return None
+            print(f"[RegionMapData] Cache hit: {cache_path.name}")
+            return packed
+        except Exception as e:
+            print(f"[RegionMapData] Failed to load cache: {e}")
+            return None
+
+    @staticmethod
+    def _save_cache(cache_path: Path, packed: np.ndarray, current_hash: str) -> None:
+        """
+        Writes the cache compressed (region ids come in large flat areas, so the
+        archive is a small fraction of the raw H*W int32 array) and atomically.
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+            with open(tmp_path, "wb") as f:
+                np.savez_compressed(f, packed=packed, hash=current_hash)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"[RegionMapData] Failed to write cache: {e}")
 
     def get_region_id(self, x: int, y: int) -> int:
         """
         Used by Server (Move Validation) and Client (Mouse Hover).
         """
         if 0 <= x < self.width and 0 <= y < self.height:
-            return int(self.packed_map[y, x])
-        return 0
\ No newline at end of file
+            # .item() returns a Python int straight from the buffer (no NumPy scalar boxing)
+            return self.packed_map.item(y, x)
+        return 0
@@ -3,6 +3,41 @@ import numpy as np
 from pathlib import Path
 from typing import Tuple, Dict, Optional
 
+# Digests already computed this process, keyed by (path, size, mtime).
+# RegionMapData and MapIndexer both key their caches on the map image,
+# so the second caller reuses the first one's hash instead of re-reading the file.
+_hash_memo: Dict[Tuple[str, int, int], str] = {}
+
+def compute_file_hash(file_path: Path) -> str:
+    """
+    Computes SHA-256 hash of the file content for data integrity.
+    Reads in chunks to define memory usage.
+    """
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
+        # Fallback if file is missing (though unlikely in this flow)
+        return "FILE_NOT_FOUND"
+
+    key = (str(file_path.resolve()), stat.st_size, stat.st_mtime_ns)
+    cached = _hash_memo.get(key)
+    if cached is not None:
+        return cached
+
+    sha256 = hashlib.sha256()
+    try:
+        with open(file_path, "rb") as f:
+            # Read 4MB chunks
+            for chunk in iter(lambda: f.read(4096 * 1024), b""):
+                sha256.update(chunk)
+    except FileNotFoundError:
+        return "FILE_NOT_FOUND"
+
+    digest = sha256.hexdigest()
+    _hash_memo[key] = digest
+    return digest
+
+
 class MapIndexer:
     """
     Handles the caching and retrieval of heavy map indexing operations.
@@ -25,7 +60,8 @@ class MapIndexer:
             map_data_array: The raw numpy array of the map data to process if cache misses.
             
         Returns:
-            Tuple containing (unique_ids, dense_map_indices)
+            Tuple containing (unique_ids, dense_map_indices), where the dense
+            map is uint32 with the same (H, W) shape as 'map_data_array'.
         """
         # 1. Generate a unique filename for the cache based on the map name
         # We append .npz for numpy compressed archive
@@ -35,7 +71,7 @@ class MapIndexer:
         current_hash = self._compute_file_hash(source_path)
 
         # 3. Try to load from cache
-        cached_data = self._load_from_cache(cache_path, current_hash)
+        cached_data = self._load_from_cache(cache_path, current_hash, map_data_array.shape)
         
         if cached_data:
             print(f"[MapIndexer] Cache hit for {source_path.name}. Loaded instantly.")
@@ -46,24 +82,15 @@ class MapIndexer:
         return self._compute_and_cache(map_data_array, cache_path, current_hash)
 
     def _compute_file_hash(self, file_path: Path) -> str:
+        """SHA-256 of the source file (see compute_file_hash)."""
+        return compute_file_hash(file_path)
+
+    def _load_from_cache(self,
+                         cache_path: Path,
+                         current_hash: str,
+                         map_shape: Tuple[int, ...]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
         """
-        Computes SHA-256 hash of the file content for data integrity.
-        Reads in chunks to define memory usage.
-        """
-        sha256 = hashlib.sha256()
-        try:
-            with open(file_path, "rb") as f:
-                # Read 4MB chunks
-                for chunk in iter(lambda: f.read(4096 * 1024), b""):
-                    sha256.update(chunk)
-            return sha256.hexdigest()
-        except FileNotFoundError:
-            # Fallback if file is missing (though unlikely in this flow)
-            return "FILE_NOT_FOUND"
-
-    def _load_from_cache(self, cache_path: Path, current_hash: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
-        """
-        Attempts to load data. Returns None if cache is missing or hash mismatch.
+        Attempts to load data. Returns None if cache is missing, hash or shape mismatch.
         """
         if not cache_path.exists():
             return None
@@ -79,8 +106,18 @@ class MapIndexer:
                     print("[MapIndexer] Cache outdated (hash mismatch).")
                     return None
                 
+                # SHAPE CHECK
+                # The index is stored with the map's (H, W) shape; older caches
+                # hold a flat array, which is reshaped (a view) when the size fits.
+                dense_map = data['dense_map']
+                if dense_map.size != int(np.prod(map_shape)):
+                    print("[MapIndexer] Cache outdated (shape mismatch).")
+                    return None
+
                 # Return copies of the arrays to ensure they are writable/safe
-                return data['unique_ids'], data['dense_map']
+                # (caches written before the uint32 layout are converted once here)
+                dense_map = dense_map.astype(np.uint32, copy=False)
+                return data['unique_ids'], dense_map.reshape(map_shape)
         except Exception as e:
             print(f"[MapIndexer] Failed to load cache: {e}")
             return None
@@ -93,7 +130,12 @@ class MapIndexer:
         Performs the heavy np.unique operation and saves the result.
         """
         # The heavy operation
+        # The inverse is flat or shaped depending on the NumPy version;
+        # pin it to the map's (H, W) layout so every consumer gets one shape.
         unique_ids, dense_map = np.unique(map_array, return_inverse=True)
+        # The inverse comes back as intp (8 bytes/pixel); dense ids fit in 32 bits,
+        # which halves the cache and makes it the texture's texel format as-is.
+        dense_map = dense_map.astype(np.uint32).reshape(map_array.shape)
         
         # Save compressed. 
         # We store the hash inside the file to verify integrity later.
@@ -1,4 +1,4 @@
-from typing import Protocol, List, runtime_checkable
+from typing import Protocol, List, Set, runtime_checkable
 from src.server.state import GameState
 from src.shared.actions import GameAction
 
@@ -24,6 +24,24 @@ class ISystem(Protocol):
         """
         ... 
 
+    @property
+    def read_set(self) -> Set[str]:
+        """
+        Names of the state resources this system reads.
+        Table names (e.g. 'regions') plus the pseudo-resources
+        'time', 'globals', 'events' and 'next_actions'.
+        Optional: systems without it are always run on their own.
+        """
+        ...
+
+    @property
+    def write_set(self) -> Set[str]:
+        """
+        Names of the state resources this system writes (same naming as read_set).
+        The Engine runs systems concurrently only when their sets do not conflict.
+        """
+        ...
+
     def update(self, state: GameState, delta_time: float) -> None:
         """
         Performs the logic for a single tick.
@@ -1,5 +1,6 @@
-from typing import List, Dict
+from typing import List, Dict, Optional, Set, Tuple
 from graphlib import TopologicalSorter, CycleError
+from concurrent.futures import ThreadPoolExecutor
 from src.server.state import GameState
 from src.shared.actions import GameAction
 from src.engine.interfaces import ISystem
@@ -14,8 +15,20 @@ class Engine:
         # Map: "base.economy" -> EconomySystem instance
         self.systems_map: Dict[str, ISystem] = {}
         
-        # The finalized, sorted list used in the loop
+        # The finalized, sorted list (kept for logging/introspection)
         self.execution_order: List[ISystem] = []
+
+        # The same systems grouped into stages. Stages run in order; systems
+        # inside a stage have no dependencies and no read/write conflicts
+        # between them, so they may run concurrently.
+        self.execution_stages: List[List[ISystem]] = []
+
+        # Worker pool for multi-system stages. Only created when such a stage
+        # actually runs (single-system stages run inline); see shutdown().
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # Action class -> the action classes it is bucketed under (see _bucket_keys)
+        self._action_keys: Dict[type, Tuple[type, ...]] = {}
         
         # Dirty flag to trigger rebuild on next tick if systems changed
         self._is_dirty = False
@@ -43,18 +56,22 @@ class Engine:
             sorter.add(sys_id, *system.dependencies)
 
         try:
-            # 2. Resolve order
-            sorted_ids = list(sorter.static_order())
-            
-            # 3. Map IDs back to Instances
-            self.execution_order = [
-                self.systems_map[sys_id] 
-                for sys_id in sorted_ids 
-                if sys_id in self.systems_map
-            ]
+            # 2. Resolve order, one dependency level at a time
+            sorter.prepare()
+            stages: List[List[ISystem]] = []
+            while sorter.is_active():
+                ready_ids = sorted(sorter.get_ready())  # sorted for deterministic stages
+                
+                # 3. Map IDs back to Instances (unknown dependency ids are skipped)
+                ready = [self.systems_map[sys_id] for sys_id in ready_ids if sys_id in self.systems_map]
+                stages.extend(self._partition_conflicts(ready))
+                sorter.done(*ready_ids)
+
+            self.execution_stages = stages
+            self.execution_order = [system for stage in stages for system in stage]
             
-            order_names = [s.id for s in self.execution_order]
-            print(f"[Engine] Graph resolved. Execution Order: {order_names}")
+            order_names = [[s.id for s in stage] for stage in stages]
+            print(f"[Engine] Graph resolved. Execution Stages: {order_names}")
             self._is_dirty = False
 
         except CycleError as e:
@@ -64,6 +81,65 @@ class Engine:
             print(f"[Engine] Error building system graph: {e}")
             raise e
 
+    @staticmethod
+    def _get_access(system: ISystem) -> Optional[Tuple[Set[str], Set[str]]]:
+        """Returns (read_set, write_set), or None if the system does not declare them."""
+        reads = getattr(system, "read_set", None)
+        writes = getattr(system, "write_set", None)
+        if reads is None or writes is None:
+            return None
+        return set(reads), set(writes)
+
+    def _partition_conflicts(self, systems: List[ISystem]) -> List[List[ISystem]]:
+        """
+        Greedily packs independent systems into concurrent groups.
+        Two systems conflict if either writes a resource the other reads or writes.
+        Systems without declared access sets always get a group of their own.
+        """
+        groups: List[List[ISystem]] = []
+        group_access: List[Optional[Tuple[Set[str], Set[str]]]] = []
+
+        for system in systems:
+            access = self._get_access(system)
+            placed = False
+            if access is not None:
+                reads, writes = access
+                for i, other in enumerate(group_access):
+                    if other is None:
+                        continue
+                    other_reads, other_writes = other
+                    if writes & (other_reads | other_writes) or other_writes & reads:
+                        continue
+                    groups[i].append(system)
+                    other_reads |= reads
+                    other_writes |= writes
+                    placed = True
+                    break
+
+            if not placed:
+                groups.append([system])
+                group_access.append(access)
+
+        return groups
+
+    def _bucket_keys(self, action_type: type) -> Tuple[type, ...]:
+        """The class itself plus its GameAction ancestors (GameAction excluded). Cached per class."""
+        keys = self._action_keys.get(action_type)
+        if keys is None:
+            keys = tuple(
+                cls for cls in action_type.__mro__
+                if cls is not GameAction and isinstance(cls, type) and issubclass(cls, GameAction)
+            ) or (action_type,)
+            self._action_keys[action_type] = keys
+        return keys
+
+    def _run_system(self, system: ISystem, state: GameState, delta_time: float):
+        try:
+            system.update(state, delta_time)
+        except Exception as e:
+            # In production, we might want to isolate the crash so the whole server doesn't die.
+            print(f"[Engine] Error in system '{system.id}': {e}")
+
     def step(self, state: GameState, actions: List[GameAction], delta_time: float):
         """
         Runs one tick of the simulation using the sorted graph.
@@ -77,14 +153,52 @@ class Engine:
 
         # 2. Inject Inputs
         state.globals["tick"] = state.globals.get("tick", 0) + 1
+
+        # Actions queued by systems last tick run before this tick's external inputs
+        if state.next_actions:
+            actions = state.next_actions + list(actions)
+            state.next_actions = []
         state.current_actions = actions
+
+        # Bucket actions by type once, so each system reads only its own kinds.
+        # An action is filed under every action class in its MRO, so systems
+        # asking for a base class also get its subclasses (as isinstance did).
+        buckets: Dict[type, List[GameAction]] = {}
+        for action in actions:
+            for key in self._bucket_keys(type(action)):
+                buckets.setdefault(key, []).append(action)
+        state.actions_by_type = buckets
         
-        # 3. Run All Systems in Strict Order
+        # 3. Run All Stages in Strict Order
         # TimeSystem will likely run first (if dep graph is correct), generating events.
         # Economy/Politics systems will run later, consuming those events.
-        for system in self.execution_order:
-            try:
-                system.update(state, delta_time)
-            except Exception as e:
-                # In production, we might want to isolate the crash so the whole server doesn't die.
-                print(f"[Engine] Error in system '{system.id}': {e}")
\ No newline at end of file
+        # Systems inside a stage touch disjoint state, so the stage end is the sync point.
+        for stage in self.execution_stages:
+            if len(stage) == 1:
+                self._run_system(stage[0], state, delta_time)
+                continue
+
+            if self._executor is None:
+                widest = max(len(s) for s in self.execution_stages)
+                self._executor = ThreadPoolExecutor(max_workers=widest, thread_name_prefix="engine")
+            futures = [self._executor.submit(self._run_system, system, state, delta_time) for system in stage]
+            for future in futures:
+                future.result()
+
+        # 4. Write Barrier
+        # Commit any staged column updates that no later system has read yet.
+        # Staged plans execute here, outside _run_system, so their errors are
+        # caught and logged the same way instead of aborting the tick.
+        try:
+            state.flush()
+        except Exception as e:
+            print(f"[Engine] Error in write barrier: {e}")
+
+    def shutdown(self):
+        """
+        Stops the worker pool, if one was started. Safe to call more than once;
+        a later step() that needs the pool creates a new one.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -7,6 +7,7 @@ from typing import List, Dict, Any, get_type_hints
 from datetime import datetime
 
 from src.server.state import GameState
+from src.shared.actions import action_from_dict
 from src.shared.config import GameConfig
 
 class DataLoader:
@@ -70,17 +71,23 @@ class DataLoader:
                 else:
                     constructor_args[key] = pl.DataFrame()
 
-            # Strategy C: Nested Dataclasses (e.g., state.time)
+            # Strategy C: Action queues (e.g., state.next_actions)
+            elif field.metadata.get("actions"):
+                actions = (action_from_dict(data) for data in meta_data.get(key, []))
+                constructor_args[key] = [a for a in actions if a is not None]
+
+            # Strategy D: Nested Dataclasses (e.g., state.time)
             elif dataclasses.is_dataclass(target_type):
                 data_dict = meta_data.get(key, {})
                 constructor_args[key] = target_type(**data_dict) # type: ignore
 
-            # Strategy D: Primitives (globals, tick, etc.)
+            # Strategy E: Primitives (globals, tick, etc.)
             else:
                 if key in meta_data:
                     constructor_args[key] = meta_data[key]
 
         state = GameState(**constructor_args)
+        self._ensure_runtime_columns(state)
         print(f"[DataLoader] Save loaded successfully. Tick: {state.globals.get('tick', 0)}")
         return state
 
@@ -116,9 +123,31 @@ class DataLoader:
         # --- 2. COUNTRIES ---
         countries_df = self._load_countries()
         state.update_table("countries", countries_df if not countries_df.is_empty() else pl.DataFrame())
+
+        self._ensure_runtime_columns(state)
              
         return state
 
+    def _ensure_runtime_columns(self, state: GameState):
+        """
+        One-time schema migration for columns the simulation writes but the
+        static data does not ship. Done at load so systems can assume the schema
+        instead of checking (and copying the table) every tick.
+        """
+        regions = state.tables.get("regions")
+        if regions is not None and "owner" in regions.columns and "controller" not in regions.columns:
+            state.update_table("regions", regions.with_columns(pl.col("owner").alias("controller")))
+
+        countries = state.tables.get("countries")
+        if countries is not None and "id" in countries.columns:
+            missing = [
+                pl.lit(0, dtype=pl.Int64).alias(col)
+                for col in ("military_count", "manpower_pool")
+                if col not in countries.columns
+            ]
+            if missing:
+                state.update_table("countries", countries.with_columns(missing))
+
     def _read_clean_tsv(self, path: Path) -> pl.DataFrame:
         """Reads TSV, forcing 'hex' to string, and ignoring '_' columns."""
         try:
@@ -151,17 +180,13 @@ class DataLoader:
         return pl.concat(dfs, how="vertical").unique(subset=["hex"], keep="last")
 
     def _generate_int_id(self, df: pl.DataFrame) -> pl.DataFrame:
-        df = df.with_columns([
-            pl.col("hex").str.slice(0, 2).map_elements(lambda x: int(x, 16), return_dtype=pl.UInt32).alias("_r"),
-            pl.col("hex").str.slice(2, 2).map_elements(lambda x: int(x, 16), return_dtype=pl.UInt32).alias("_g"),
-            pl.col("hex").str.slice(4, 2).map_elements(lambda x: int(x, 16), return_dtype=pl.UInt32).alias("_b"),
-        ])
-        df = df.with_columns(
-            (pl.col("_b") + (pl.col("_g") * 256) + (pl.col("_r") * 65536)).cast(pl.Int32).alias("id")
+        # RRGGBB read as one base-16 number is exactly B + G*256 + R*65536,
+        # parsed natively instead of three Python int(x, 16) calls per row.
+        # Restore '#' to the hex column in the same pass.
+        return df.with_columns(
+            pl.col("hex").str.slice(0, 6).str.to_integer(base=16).cast(pl.Int32).alias("id"),
+            ("#" + pl.col("hex")).alias("hex"),
         )
-        # Restore '#' to the hex column
-        df = df.with_columns(("#" + pl.col("hex")).alias("hex"))
-        return df.drop(["_r", "_g", "_b"])
 
     def _enrich_regions_data(self, main_df: pl.DataFrame) -> pl.DataFrame:
         for data_dir in self.config.get_data_dirs():
@@ -4,6 +4,7 @@ import orjson
 from pathlib import Path
 from typing import get_type_hints, Any
 from src.server.state import GameState
+from src.shared.actions import action_from_dict
 from src.shared.config import GameConfig
 
 class SaveStateLoader:
@@ -57,7 +58,13 @@ class SaveStateLoader:
                 else:
                     constructor_args[key] = pl.DataFrame()
 
-            # Strategy C: Nested Dataclasses (e.g., state.time)
+            # Strategy C: Action queues (e.g., state.next_actions)
+            # Entries whose action class is no longer loaded are skipped
+            elif field.metadata.get("actions"):
+                actions = (action_from_dict(data) for data in meta.get(key, []))
+                constructor_args[key] = [a for a in actions if a is not None]
+
+            # Strategy D: Nested Dataclasses (e.g., state.time)
             # We reconstruct them from the dictionary found in meta.json
             elif dataclasses.is_dataclass(target_type):
                 data_dict = meta.get(key, {})
@@ -68,7 +75,7 @@ class SaveStateLoader:
                     # Fallback for empty/corrupt data
                     constructor_args[key] = target_type() # type: ignore
 
-            # Strategy D: Primitives (int, float, list, etc.)
+            # Strategy E: Primitives (int, float, list, etc.)
             else:
                 if key in meta:
                     constructor_args[key] = meta[key]
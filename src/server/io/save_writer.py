@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import List, Dict, Any
 
 from src.server.state import GameState
+from src.shared.actions import action_to_dict
 from src.shared.config import GameConfig
 
 class SaveWriter:
@@ -75,6 +76,10 @@ class SaveWriter:
         }
 
         for field in dataclasses.fields(state):
+            # Per-tick scratch data (e.g. action buckets) is never persisted
+            if field.metadata.get("transient"):
+                continue
+
             key = field.name
             value = getattr(state, key)
 
@@ -89,11 +94,15 @@ class SaveWriter:
                 for tbl_name, df in value.items():
                     df.write_parquet(sub_dir / f"{tbl_name}.parquet")
 
-            # Strategy C: Dataclasses -> Dict (for JSON)
+            # Strategy C: Action queues -> List of tagged dicts (for JSON)
+            elif field.metadata.get("actions"):
+                meta_data[key] = [action_to_dict(action) for action in value]
+
+            # Strategy D: Dataclasses -> Dict (for JSON)
             elif dataclasses.is_dataclass(value):
                 meta_data[key] = dataclasses.asdict(value) # type: ignore
 
-            # Strategy D: Primitives -> JSON
+            # Strategy E: Primitives -> JSON
             else:
                 meta_data[key] = value
 
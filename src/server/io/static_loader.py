@@ -161,18 +161,11 @@ class StaticAssetLoader:
             .alias("hex")
         )
 
-        # Slice hex string into components and compute integer ID
-        df = df.with_columns([
-            pl.col("hex").str.slice(1, 2).map_elements(lambda x: int(x, 16), return_dtype=pl.UInt32).alias("_r"),
-            pl.col("hex").str.slice(3, 2).map_elements(lambda x: int(x, 16), return_dtype=pl.UInt32).alias("_g"),
-            pl.col("hex").str.slice(5, 2).map_elements(lambda x: int(x, 16), return_dtype=pl.UInt32).alias("_b"),
-        ])
-        
-        df = df.with_columns(
-            (pl.col("_b") + (pl.col("_g") * 256) + (pl.col("_r") * 65536)).cast(pl.Int32).alias("id")
+        # RRGGBB read as one base-16 number is exactly B + G*256 + R*65536.
+        # Parsed natively by Polars (no Python call per row and channel).
+        return df.with_columns(
+            pl.col("hex").str.slice(1, 6).str.to_integer(base=16).cast(pl.Int32).alias("id")
         )
-        
-        return df.drop(["_r", "_g", "_b"])
 
     # =========================================================================
     # SECTION: TOML LOADING (Definitions & World)
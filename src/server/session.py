@@ -97,7 +97,7 @@ class GameSession:
                 map_path = config.get_asset_path("map/regions.png")
 
             # Initialize the Core MapData component
-            map_data = RegionMapData(str(map_path))
+            map_data = RegionMapData(str(map_path), config.cache_dir)
 
             # --- Step 5: Engine & Systems (90%) ---
             report(0.8, "Server: Registering game systems...")
@@ -126,6 +126,12 @@ class GameSession:
         
         self.action_queue.clear()
 
+    def shutdown(self):
+        """
+        Releases the simulation's background resources (engine worker threads).
+        """
+        self.engine.shutdown()
+
     def receive_action(self, action: GameAction):
         """
         Endpoint for Clients to submit commands.
@@ -1,11 +1,13 @@
+import numpy as np
 import polars as pl
 from dataclasses import dataclass, field
-from typing import Dict, Any, List, TYPE_CHECKING
+from typing import Dict, Any, List, Optional, Tuple, Type
 from datetime import datetime
 
-if TYPE_CHECKING:
-    from src.shared.actions import GameAction
-    from src.shared.events import GameEvent
+# Imported at runtime (not under TYPE_CHECKING): the save loaders resolve
+# GameState's field types with get_type_hints
+from src.shared.actions import ActionBatch, GameAction
+from src.shared.events import GameEvent
 
 # The starting point for the simulation time (Epoch).
 # We use this to calculate the date from 'total_minutes'.
@@ -44,6 +46,10 @@ class TimeData:
     # (Not intended for use by other systems).
     _accumulator: float = 0.0
 
+def _same_column(old: pl.Series, new: pl.Series) -> bool:
+    """True if two columns hold the same values in the same order (one vectorized compare)."""
+    return old is new or (old.len() == new.len() and old.dtype == new.dtype and old.equals(new))
+
 @dataclass
 class GameState:
     """
@@ -73,16 +79,272 @@ class GameState:
     # The Engine populates this before systems update.
     current_actions: List['GameAction'] = field(default_factory=list)
 
+    # NOTE: Fields marked 'transient' are per-tick scratch data and are skipped by SaveWriter.
+    # Fields marked 'actions' are lists of GameActions, saved with their class name.
+
+    # Actions generated by systems during this tick (e.g. AI orders).
+    # The Engine injects them at the start of the NEXT tick, so they are saved.
+    next_actions: List['GameAction'] = field(default_factory=list, metadata={"actions": True})
+
+    # The same actions bucketed by class (e.g. ActionBuildUnit -> [...]), in arrival order.
+    # Each action is also listed under its action base classes, so a lookup matches
+    # what isinstance would. Built once per tick by the Engine so systems can fetch
+    # their actions in O(1) instead of each filtering 'current_actions'.
+    actions_by_type: Dict[Type['GameAction'], List['GameAction']] = field(default_factory=dict, metadata={"transient": True})
+
+    # Lazily built 'id' -> row number indexes, keyed by table name.
+    # Each entry is (frame, id column, index). Replacing a table only costs a
+    # vectorized compare of its id column: row order survives with_columns and
+    # flush, so the index is rebuilt only when the ids themselves change.
+    _row_index: Dict[str, Tuple[pl.DataFrame, pl.Series, Dict[Any, int]]] = field(
+        default_factory=dict, repr=False, metadata={"transient": True}
+    )
+
+    # Lazily built inverted index: owner tag -> int32 array of region ids.
+    # Entry is (frame, id column, owner column, index); like '_row_index', it is
+    # only rebuilt when one of those two columns actually changed.
+    _owner_index: Optional[Tuple[pl.DataFrame, pl.Series, pl.Series, Dict[str, np.ndarray]]] = field(
+        default=None, repr=False, metadata={"transient": True}
+    )
+
+    # Lazily built partition: owner tag -> that owner's rows of 'regions'.
+    # Same invalidation rule as '_row_index' (tied to the 'regions' frame it came from).
+    _owner_frames: Optional[Tuple[pl.DataFrame, Dict[str, pl.DataFrame]]] = field(
+        default=None, repr=False, metadata={"transient": True}
+    )
+
+    # Staged point updates waiting to be committed, keyed by table name.
+    # Each entry is (id_col, ids, column, values) with typed Series; see stage_column_update.
+    _pending_updates: Dict[str, List[Tuple[str, pl.Series, str, pl.Series]]] = field(
+        default_factory=dict, repr=False, metadata={"transient": True}
+    )
+
+    # Staged query plans waiting to be collected, keyed by table name; see stage_lazy.
+    _pending_lazy: Dict[str, pl.LazyFrame] = field(
+        default_factory=dict, repr=False, metadata={"transient": True}
+    )
+
     def get_table(self, name: str) -> pl.DataFrame:
         """
         Retrieves a reference to a simulation table.
+        No copy is made: every system in a tick shares the same (immutable) frame
+        until someone calls update_table.
+        Staged updates for this table are committed first (read barrier).
+        """
+        if name in self._pending_lazy or name in self._pending_updates:
+            self.flush(name)
+        try:
+            return self.tables[name]
+        except KeyError:
+            raise KeyError(f"Table '{name}' not found in GameState.") from None
+
+    def get_table_lazy(self, name: str) -> pl.LazyFrame:
+        """
+        Returns the table as a LazyFrame for composing a query plan.
+        If another system already staged a plan for this table during the tick,
+        that plan is returned so the new work is chained onto it (nothing is
+        executed until the write barrier).
         """
-        if name not in self.tables:
-            raise KeyError(f"Table '{name}' not found in GameState.")
-        return self.tables[name]
+        if name in self._pending_updates:
+            self.flush(name)
+        lf = self._pending_lazy.get(name)
+        if lf is None:
+            lf = self.get_table(name).lazy()
+        return lf
+
+    def stage_lazy(self, name: str, lf: pl.LazyFrame):
+        """
+        Stages a LazyFrame as the new value of a table.
+        All staged plans are collected together by flush() with pl.collect_all,
+        so Polars can optimize them as one batch.
+        """
+        self._pending_lazy[name] = lf
 
     def update_table(self, name: str, df: pl.DataFrame):
         """
         Replaces a table in the state (Copy-on-Write).
         """
-        self.tables[name] = df
\ No newline at end of file
+        # An eager write supersedes any plan or point update staged for the same table
+        self._pending_lazy.pop(name, None)
+        self._pending_updates.pop(name, None)
+        self.tables[name] = df
+
+    def stage_column_update(self, table: str, id_col: str, ids: List[Any], column: str, values: List[Any]):
+        """
+        Queues "set table.column = value WHERE id_col == id" for many rows at once.
+        
+        The ids and values are converted to the table's column types right away
+        (strictly), so a wrong type raises here, in the system that staged it,
+        instead of at the end-of-tick flush. The table itself is not copied:
+        all staged updates of a table are committed together by flush() -
+        either when the table is next read through get_table() or by the
+        Engine at the end of the tick.
+        If the same row is staged twice, the last value wins. Null values are ignored.
+        """
+        if len(ids) == 0:
+            return
+        if len(ids) != len(values):
+            raise ValueError(f"stage_column_update: {len(ids)} ids but {len(values)} values for '{table}.{column}'")
+
+        schema = self._staged_schema(table)
+        ids = pl.Series(id_col, ids, dtype=schema[id_col], strict=True)
+        values = pl.Series(column, values, dtype=schema[column], strict=True)
+        self._pending_updates.setdefault(table, []).append((id_col, ids, column, values))
+
+    def _staged_schema(self, name: str) -> pl.Schema:
+        """Schema the table will have when staged point updates are applied to it."""
+        lf = self._pending_lazy.get(name)
+        if lf is not None:
+            return lf.collect_schema()
+        try:
+            return self.tables[name].schema
+        except KeyError:
+            raise KeyError(f"Table '{name}' not found in GameState.") from None
+
+    def flush(self, name: Optional[str] = None):
+        """
+        Commits staged updates (for one table, or all).
+        1. Staged LazyFrames are collected in one pl.collect_all call.
+        2. Staged point updates are applied with a single lazy query per table:
+           one small left join per updated column + one coalesce projection.
+        A table whose staged work fails is logged and left as it was; every
+        other table's updates are still committed, so one bad system cannot
+        abort the tick or discard the others' writes.
+        """
+        lazy_names = [name] if name is not None else list(self._pending_lazy)
+        lazy_names = [n for n in lazy_names if n in self._pending_lazy]
+        if lazy_names:
+            plans = [self._pending_lazy.pop(n) for n in lazy_names]
+            try:
+                frames = pl.collect_all(plans)
+            except Exception:
+                # Find the failing plan(s): collect each one on its own
+                frames = [self._collect_or_drop(table, plan) for table, plan in zip(lazy_names, plans)]
+            for table, df in zip(lazy_names, frames):
+                if df is not None:
+                    self.tables[table] = df
+
+        names = [name] if name is not None else list(self._pending_updates)
+        for table in names:
+            ops = self._pending_updates.pop(table, None)
+            if not ops:
+                continue
+            try:
+                self.tables[table] = self._apply_point_updates(self.tables[table], ops)
+            except Exception as e:
+                print(f"[GameState] Dropped staged updates for table '{table}': {e}")
+
+    @staticmethod
+    def _collect_or_drop(table: str, plan: pl.LazyFrame) -> Optional[pl.DataFrame]:
+        try:
+            return plan.collect()
+        except Exception as e:
+            print(f"[GameState] Dropped staged plan for table '{table}': {e}")
+            return None
+
+    @staticmethod
+    def _apply_point_updates(df: pl.DataFrame, ops: List[Tuple[str, pl.Series, str, pl.Series]]) -> pl.DataFrame:
+        # Merge ops that target the same column, keeping their order (last wins)
+        merged: Dict[Tuple[str, str], Tuple[List[pl.Series], List[pl.Series]]] = {}
+        for id_col, ids, column, values in ops:
+            bucket_ids, bucket_values = merged.setdefault((id_col, column), ([], []))
+            bucket_ids.append(ids)
+            bucket_values.append(values)
+
+        lf = df.lazy()
+        exprs, tmp_cols = [], []
+        for i, ((id_col, column), (ids, values)) in enumerate(merged.items()):
+            tmp = f"_staged_{i}"
+            # Already typed by stage_column_update; a cast only runs if the table changed since
+            changes = pl.DataFrame({
+                id_col: pl.concat(ids).cast(df.schema[id_col]),
+                tmp: pl.concat(values).cast(df.schema[column]),
+            }).unique(subset=id_col, keep="last", maintain_order=True)
+            lf = lf.join(changes.lazy(), on=id_col, how="left", maintain_order="left")
+            exprs.append(pl.coalesce([tmp, column]).alias(column))
+            tmp_cols.append(tmp)
+
+        return lf.with_columns(exprs).drop(tmp_cols).collect()
+
+    def get_row_index(self, name: str) -> Dict[Any, int]:
+        """
+        Returns a hash index {id: row_number} for a table with an 'id' column.
+        Built on first use and again only when the id column changes, then O(1) per lookup.
+        """
+        df = self.get_table(name)
+        cached = self._row_index.get(name)
+        if cached is not None and cached[0] is df:
+            return cached[2]
+
+        ids = df.get_column("id")
+        if cached is not None and _same_column(cached[1], ids):
+            # New frame, same ids in the same order (e.g. a population tick)
+            self._row_index[name] = (df, ids, cached[2])
+            return cached[2]
+
+        index = dict(zip(ids.to_list(), range(df.height)))
+        self._row_index[name] = (df, ids, index)
+        return index
+
+    def lookup_row(self, name: str, row_id: Any) -> Optional[Dict[str, Any]]:
+        """Point lookup by 'id' without scanning the table. Returns None if missing."""
+        row = self.get_row_index(name).get(row_id)
+        if row is None:
+            return None
+        return self.get_table(name).row(row, named=True)
+
+    def get_region_ids_by_owner(self, owner: str) -> np.ndarray:
+        """
+        All region ids owned by 'owner' as a contiguous int32 array (empty if none).
+        The index is rebuilt only when the owner (or id) column changes; repeat
+        queries (e.g. country selection clicks) are a dict hit.
+        """
+        regions = self.get_table("regions")
+        cached = self._owner_index
+        if cached is None or cached[0] is not regions:
+            ids = regions.get_column("id")
+            owners = regions.get_column("owner")
+            if cached is not None and _same_column(cached[1], ids) and _same_column(cached[2], owners):
+                # New frame, no ownership change (e.g. a population tick)
+                cached = (regions, ids, owners, cached[3])
+            else:
+                grouped = regions.group_by("owner").agg(pl.col("id").cast(pl.Int32))
+                index = {
+                    tag: np.asarray(group_ids, dtype=np.int32)
+                    for tag, group_ids in zip(grouped.get_column("owner").to_list(), grouped.get_column("id").to_list())
+                }
+                cached = (regions, ids, owners, index)
+            self._owner_index = cached
+        return cached[3].get(owner, np.empty(0, dtype=np.int32))
+
+    def get_regions_by_owner(self, owner: str) -> pl.DataFrame:
+        """
+        The rows of 'regions' owned by 'owner' (an empty frame if none).
+        The table is partitioned by owner once per 'regions' frame, so repeat
+        queries (panels every frame, campaign start) are a dict hit instead of
+        a full-column filter.
+        """
+        regions = self.get_table("regions")
+        cached = self._owner_frames
+        if cached is None or cached[0] is not regions:
+            parts = regions.partition_by("owner", as_dict=True)
+            cached = (regions, {key[0]: part for key, part in parts.items()})
+            self._owner_frames = cached
+        part = cached[1].get(owner)
+        return part if part is not None else regions.clear()
+
+    def get_action_batch(self, action_type: Type['GameAction']) -> Optional[ActionBatch]:
+        """
+        Returns this tick's actions of 'action_type' as a Struct-of-Arrays batch,
+        or None if there are none.
+        """
+        actions = self.actions_by_type.get(action_type)
+        if not actions:
+            return None
+        return ActionBatch.from_actions(action_type, actions)
+
+    def lookup_region(self, region_id: int) -> Optional[Dict[str, Any]]:
+        return self.lookup_row("regions", region_id)
+
+    def lookup_country(self, tag: str) -> Optional[Dict[str, Any]]:
+        return self.lookup_row("countries", tag)
@@ -1,7 +1,8 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, fields, asdict
+from operator import attrgetter
+from typing import Optional, Dict, List, Any, Sequence, Type
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GameAction:
     """
     Base class for all discrete game actions following the Command Pattern.
@@ -10,13 +11,16 @@ class GameAction:
         In this Data-Oriented architecture, Clients do not modify the GameState directly.
         Instead, they issue Actions. The Engine then processes these Actions deterministically.
         This approach simplifies networking (sending actions) and replays.
+        Actions are frozen: once issued they can be queued, replayed or shared
+        across threads without defensive copies. Use dataclasses.replace() to
+        derive a modified action.
     """
     # Identifies who initiated the action ('local_player', 'server', or a specific player ID).
     player_id: str
 
 # --- Map Actions ---
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ActionSetRegionOwner(GameAction):
     """
     Transfers ownership of a specific region to a new country.
@@ -27,7 +31,7 @@ class ActionSetRegionOwner(GameAction):
 
 # --- Economy Actions ---
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ActionSetTax(GameAction):
     """
     Updates the tax rate for a specific country.
@@ -37,7 +41,7 @@ class ActionSetTax(GameAction):
 
 # --- Time & Control Actions ---
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ActionSetGameSpeed(GameAction):
     """
     Sets the target simulation speed.
@@ -51,7 +55,7 @@ class ActionSetGameSpeed(GameAction):
     """
     speed_level: int
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ActionSetPaused(GameAction):
     """
     Pauses or resumes the simulation.
@@ -60,14 +64,14 @@ class ActionSetPaused(GameAction):
     """
     is_paused: bool
     
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ActionSaveGame(GameAction):
     """
     Triggers the server to serialize the current state to disk.
     """
     save_name: str
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ActionBuildUnit(GameAction):
     """
     Orders a country to recruit a military unit.
@@ -77,7 +81,7 @@ class ActionBuildUnit(GameAction):
     unit_type: str # "infantry", "tank", etc.
     count: int
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ActionAnnexRegion(GameAction):
     """
     Formal annexation of territory (Change Owner).
@@ -85,10 +89,73 @@ class ActionAnnexRegion(GameAction):
     region_id: int
     new_owner_tag: str
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ActionOccupyRegion(GameAction):
     """
     Military occupation (Change Controller, not Owner).
     """
     region_id: int
-    new_controller_tag: str
\ No newline at end of file
+    new_controller_tag: str
+
+# --- Serialization (Save Files) ---
+
+def _action_type_name(action_type: Type[GameAction]) -> str:
+    return f"{action_type.__module__}.{action_type.__qualname__}"
+
+def action_to_dict(action: GameAction) -> Dict[str, Any]:
+    """Plain JSON-ready dict of an action, tagged with its class."""
+    data = asdict(action)
+    data["type"] = _action_type_name(type(action))
+    return data
+
+def action_from_dict(data: Dict[str, Any]) -> Optional[GameAction]:
+    """
+    Rebuilds an action written by action_to_dict. Only already imported
+    GameAction subclasses are considered (nothing is imported by name);
+    unknown types return None.
+    """
+    data = dict(data)
+    type_name = data.pop("type", None)
+    pending = list(GameAction.__subclasses__())
+    while pending:
+        action_type = pending.pop()
+        if _action_type_name(action_type) == type_name:
+            return action_type(**data)
+        pending.extend(action_type.__subclasses__())
+    return None
+
+# --- Batched (Struct of Arrays) View ---
+
+@dataclass
+class ActionBatch:
+    """
+    Struct-of-Arrays view over all actions of ONE type in a tick.
+    
+    Architecture Note:
+        Actions travel as individual dataclasses (easy to send and replay),
+        but systems process them in bulk. A batch turns N objects into one
+        list per field, e.g. batch["count"] -> [1, 5, 2], which can be handed
+        straight to Polars/NumPy without a Python loop per action.
+    """
+    action_type: Type[GameAction]
+    columns: Dict[str, List[Any]]
+    size: int
+
+    @classmethod
+    def from_actions(cls, action_type: Type[GameAction], actions: Sequence[GameAction]) -> "ActionBatch":
+        names = [f.name for f in fields(action_type)]
+        if not actions:
+            columns = {name: [] for name in names}
+        elif len(names) == 1:
+            columns = {names[0]: [getattr(a, names[0]) for a in actions]}
+        else:
+            # attrgetter pulls every field in C; zip(*) transposes rows into columns
+            rows = map(attrgetter(*names), actions)
+            columns = {name: list(col) for name, col in zip(names, zip(*rows))}
+        return cls(action_type, columns, len(actions))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, name: str) -> List[Any]:
+        return self.columns[name]
@@ -0,0 +1,43 @@
+import polars as pl
+
+from modules.base.systems.ai_system import AISystem
+from src.server.state import GameState
+
+
+def make_state() -> GameState:
+    state = GameState()
+    state.update_table("countries", pl.DataFrame({
+        "id": [f"C{i:02d}" for i in range(50)],
+        "money_reserves": [2_000_000_000] * 50,
+    }))
+    return state
+
+
+def test_ai_runs_once_per_month():
+    ai = AISystem()
+    state = make_state()
+
+    ai.update(state, 1.0)
+    state.time.day = 20
+    ai.update(state, 1.0)
+    assert state.next_actions == []
+
+    state.time.month, state.time.day = 2, 1
+    ai.update(state, 1.0)
+    issued = len(state.next_actions)
+    assert issued > 0
+
+    ai.update(state, 1.0)
+    assert len(state.next_actions) == issued
+
+
+def test_ai_runs_when_the_first_of_the_month_was_skipped():
+    ai = AISystem()
+    state = make_state()
+    ai.update(state, 1.0)
+
+    # A long frame hitch jumps from Jan 31 straight to Feb 2
+    state.time.month, state.time.day = 2, 2
+    ai.update(state, 1.0)
+
+    assert state.next_actions
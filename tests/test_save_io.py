@@ -0,0 +1,27 @@
+from pathlib import Path
+
+import polars as pl
+
+from src.server.io.save_loader import SaveStateLoader
+from src.server.io.save_writer import SaveWriter
+from src.server.state import GameState
+from src.shared.actions import ActionBuildUnit, ActionSetRegionOwner
+from src.shared.config import GameConfig
+
+
+def test_queued_actions_survive_save_and_load(tmp_path: Path):
+    config = GameConfig(tmp_path)
+    state = GameState()
+    state.update_table("countries", pl.DataFrame({"id": ["AAA"], "money_reserves": [1]}))
+    queued = [
+        ActionBuildUnit("server", country_tag="AAA", unit_type="infantry", count=1),
+        ActionSetRegionOwner("server", region_id=7, new_owner_tag="AAA"),
+    ]
+    state.next_actions.extend(queued)
+    state.actions_by_type = {ActionBuildUnit: queued[:1]}
+
+    assert SaveWriter(config).save_game(state, "slot")
+    loaded = SaveStateLoader(config).load("slot")
+
+    assert loaded.next_actions == queued
+    assert loaded.actions_by_type == {}
@@ -0,0 +1,122 @@
+from dataclasses import dataclass
+from typing import List, Optional, Set
+
+import polars as pl
+
+from modules.base.systems.territory_system import TerritorySystem
+from src.engine.simulator import Engine
+from src.server.state import GameState
+from src.shared.actions import (
+    ActionAnnexRegion, ActionOccupyRegion, ActionSetRegionOwner, GameAction,
+)
+
+
+class RecordingSystem:
+    def __init__(self, system_id: str, reads: Optional[Set[str]] = None, writes: Optional[Set[str]] = None):
+        self.id = system_id
+        self.dependencies: List[str] = []
+        if reads is not None:
+            self.read_set = reads
+        if writes is not None:
+            self.write_set = writes
+        self.calls = 0
+
+    def update(self, state: GameState, delta_time: float) -> None:
+        self.calls += 1
+
+
+def test_serial_stages_never_start_a_pool():
+    engine = Engine()
+    engine.register_systems([RecordingSystem("a"), RecordingSystem("b")])
+
+    engine.step(GameState(), [], 1.0)
+
+    assert engine._executor is None
+
+
+def test_concurrent_stage_pool_is_released_on_shutdown():
+    engine = Engine()
+    a = RecordingSystem("a", reads={"regions"}, writes={"regions"})
+    b = RecordingSystem("b", reads={"countries"}, writes={"countries"})
+    engine.register_systems([a, b])
+
+    engine.step(GameState(), [], 1.0)
+    assert (a.calls, b.calls) == (1, 1)
+    assert engine._executor is not None
+
+    engine.shutdown()
+    assert engine._executor is None
+
+    # A later tick simply starts a new pool
+    engine.step(GameState(), [], 1.0)
+    assert (a.calls, b.calls) == (2, 2)
+    engine.shutdown()
+
+
+def test_actions_are_bucketed_under_their_base_classes():
+    @dataclass(frozen=True, slots=True)
+    class ActionCedeRegion(ActionSetRegionOwner):
+        pass
+
+    engine = Engine()
+    state = GameState()
+    base = ActionSetRegionOwner("p", 1, "AAA")
+    derived = ActionCedeRegion("p", 2, "BBB")
+
+    engine.step(state, [base, derived], 1.0)
+
+    assert state.actions_by_type[ActionSetRegionOwner] == [base, derived]
+    assert state.actions_by_type[ActionCedeRegion] == [derived]
+    assert GameAction not in state.actions_by_type
+
+
+def test_territory_changes_apply_in_arrival_order():
+    engine = Engine()
+    engine.register_systems([TerritorySystem()])
+    state = GameState()
+    state.update_table("regions", pl.DataFrame({
+        "id": [1, 2],
+        "owner": ["AAA", "AAA"],
+        "controller": ["AAA", "AAA"],
+    }))
+
+    engine.step(state, [
+        ActionOccupyRegion("p", 1, "BBB"),
+        ActionAnnexRegion("p", 1, "CCC"),
+        ActionAnnexRegion("p", 2, "CCC"),
+        ActionOccupyRegion("p", 2, "BBB"),
+    ], 1.0)
+
+    regions = state.get_table("regions")
+    assert regions.get_column("owner").to_list() == ["CCC", "CCC"]
+    assert regions.get_column("controller").to_list() == ["CCC", "BBB"]
+
+
+class StagingSystem:
+    """Stages one lazy plan per table during update (no access sets: runs alone)."""
+    def __init__(self, system_id: str, plans):
+        self.id = system_id
+        self.dependencies: List[str] = []
+        self.plans = plans
+
+    def update(self, state: GameState, delta_time: float) -> None:
+        for table, make_plan in self.plans.items():
+            state.stage_lazy(table, make_plan(state.get_table_lazy(table)))
+
+
+def test_bad_staged_plan_does_not_abort_the_tick():
+    engine = Engine()
+    engine.register_systems([
+        StagingSystem("a_bad", {"regions": lambda lf: lf.with_columns(pl.col("nope") + 1)}),
+        StagingSystem("b_good", {"countries": lambda lf: lf.with_columns(pl.col("money") * 2)}),
+    ])
+    state = GameState()
+    state.update_table("regions", pl.DataFrame({"id": [1], "population": [10]}))
+    state.update_table("countries", pl.DataFrame({"id": ["AAA"], "money": [5]}))
+    state.stage_column_update("regions", "id", [1], "population", [11])
+
+    engine.step(state, [], 1.0)
+
+    # The failing plan is dropped; the other table's plan and the point update survive
+    assert state.get_table("countries").get_column("money").to_list() == [10]
+    assert state.get_table("regions").get_column("population").to_list() == [11]
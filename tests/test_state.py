@@ -0,0 +1,123 @@
+import polars as pl
+import pytest
+
+from src.server.state import GameState
+
+
+def make_state() -> GameState:
+    state = GameState()
+    state.update_table("regions", pl.DataFrame({
+        "id": [1, 2, 3],
+        "owner": ["AAA", "BBB", "AAA"],
+        "population": [100, 200, 300],
+    }))
+    return state
+
+
+def test_staged_update_last_write_wins():
+    state = make_state()
+    state.stage_column_update("regions", "id", [2], "owner", ["CCC"])
+    state.stage_column_update("regions", "id", [2, 3], "owner", ["DDD", "EEE"])
+
+    regions = state.get_table("regions")
+
+    assert regions.get_column("owner").to_list() == ["AAA", "DDD", "EEE"]
+
+
+def test_staged_update_ignores_null_values():
+    state = make_state()
+    state.stage_column_update("regions", "id", [1, 2], "population", [None, 250])
+
+    regions = state.get_table("regions")
+
+    assert regions.get_column("population").to_list() == [100, 250, 300]
+
+
+def test_staged_update_unknown_id_is_noop():
+    state = make_state()
+    before = state.get_table("regions")
+    state.stage_column_update("regions", "id", [99], "owner", ["ZZZ"])
+
+    regions = state.get_table("regions")
+
+    assert regions.equals(before)
+
+
+def test_flush_keeps_row_order_and_other_columns():
+    state = make_state()
+    state.stage_column_update("regions", "id", [3, 1], "population", [30, 10])
+    state.flush()
+
+    regions = state.get_table("regions")
+
+    assert regions.get_column("id").to_list() == [1, 2, 3]
+    assert regions.get_column("population").to_list() == [10, 200, 30]
+    assert regions.get_column("owner").to_list() == ["AAA", "BBB", "AAA"]
+
+
+def test_update_table_drops_staged_updates():
+    state = make_state()
+    state.stage_column_update("regions", "id", [1], "owner", ["CCC"])
+    replacement = pl.DataFrame({"id": [1], "owner": ["BBB"], "population": [5]})
+    state.update_table("regions", replacement)
+
+    regions = state.get_table("regions")
+
+    assert regions.get_column("owner").to_list() == ["BBB"]
+
+
+def test_row_index_survives_value_only_replacement():
+    state = make_state()
+    index = state.get_row_index("regions")
+
+    state.update_table("regions", state.get_table("regions").with_columns(pl.col("population") * 2))
+
+    assert state.get_row_index("regions") is index
+    assert state.lookup_region(3)["population"] == 600
+
+
+def test_row_index_rebuilt_when_ids_change():
+    state = make_state()
+    state.get_row_index("regions")
+
+    state.update_table("regions", state.get_table("regions").reverse())
+
+    assert state.lookup_region(1)["owner"] == "AAA"
+    assert state.get_row_index("regions")[1] == 2
+
+
+def test_owner_index_follows_ownership_changes():
+    state = make_state()
+    assert state.get_region_ids_by_owner("AAA").tolist() == [1, 3]
+
+    state.stage_column_update("regions", "id", [3], "owner", ["BBB"])
+
+    assert state.get_region_ids_by_owner("AAA").tolist() == [1]
+    assert sorted(state.get_region_ids_by_owner("BBB").tolist()) == [2, 3]
+    assert state.get_region_ids_by_owner("ZZZ").size == 0
+
+
+def test_owner_index_survives_value_only_replacement():
+    state = make_state()
+    index = state.get_region_ids_by_owner("AAA")
+
+    state.update_table("regions", state.get_table("regions").with_columns(pl.col("population") + 1))
+
+    assert state.get_region_ids_by_owner("AAA") is index
+
+
+def test_staged_update_rejects_wrong_types_when_staged():
+    state = make_state()
+
+    with pytest.raises(TypeError):
+        state.stage_column_update("regions", "id", [1], "population", ["many"])
+
+    # Nothing was queued, so the next read is unaffected
+    assert state.get_table("regions").get_column("population").to_list() == [100, 200, 300]
+
+
+def test_staged_update_rejects_length_mismatch():
+    state = make_state()
+
+    with pytest.raises(ValueError):
+        state.stage_column_update("regions", "id", [1, 2], "population", [5])